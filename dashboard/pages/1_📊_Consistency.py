@@ -200,14 +200,15 @@ try:
     st.subheader("4-Week Rolling Average")
 
     # Calculate rolling average
-    weekly_sorted = weekly_filtered.sort_values(['year', 'week'])
-    weekly_sorted['rolling_avg'] = weekly_sorted['distance_km'].rolling(window=4, min_periods=1).mean()
+    # Only the columns the chart needs, and the average as a plain array
+    weekly_sorted = weekly_filtered[['year', 'week', 'week_key', 'distance_km']].sort_values(['year', 'week'])
+    rolling_avg = weekly_sorted['distance_km'].rolling(window=4, min_periods=1).mean().to_numpy()
 
     fig_rolling = go.Figure()
 
     fig_rolling.add_trace(go.Scatter(
         x=weekly_sorted['week_key'],
-        y=weekly_sorted['rolling_avg'],
+        y=rolling_avg,
         mode='lines+markers',
         line=dict(color='blue', width=3),
         marker=dict(size=8),
@@ -7,6 +7,7 @@ Assess race readiness and build confidence through data-driven analysis.
 import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
@@ -177,7 +178,8 @@ try:
 
     if degradation_data:
         deg_df = pd.DataFrame(degradation_data).sort_values('date')
-        colors = ['#00cc00' if d <= 3 else '#ffa500' if d <= 7 else '#ff4b4b' for d in deg_df['degradation']]
+        deg = deg_df['degradation'].to_numpy(dtype=float)
+        colors = np.select([deg <= 3, deg <= 7], ['#00cc00', '#ffa500'], default='#ff4b4b').tolist()
         fig_deg = go.Figure()
         fig_deg.add_trace(go.Bar(
             x=deg_df['date'], y=deg_df['degradation'], marker_color=colors,
@@ -45,6 +45,14 @@ MONTH_RISK = {
 month_names = ["", "January", "February", "March", "April", "May", "June",
                "July", "August", "September", "October", "November", "December"]
 
+# Load data - the weekly rollup is cached with it so reruns only slice the tail
+@st.cache_data(ttl=300)  # Cache for 5 minutes to avoid pickle issues
+def load_data():
+    df = activities_to_dataframe()
+    return df, get_weekly_summary(df)
+
+df, weekly = load_data()
+
 # Get current month risk
 risk_level, risk_icon, historical_rate, risk_note = MONTH_RISK[current_month]
 
@@ -69,7 +77,6 @@ with col2:
 
 with col3:
     # Calculate current week distance
-    df = activities_to_dataframe()
     if not df.empty:
         current_year = today.year
         current_week_key = f"{current_year}-W{current_week:02d}"
@@ -302,7 +309,6 @@ st.divider()
 # Weekly tracking
 st.markdown("## 📈 Recent Weeks Tracking")
 
-weekly = get_weekly_summary(df)
 if not weekly.empty:
     # Show last 8 weeks
     recent = weekly.tail(8).copy()
@@ -6,8 +6,8 @@ Monitor training stress, recovery metrics, and physiological trends.
 
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
@@ -20,7 +20,9 @@ from utils.data_loader import (
     get_weekly_summary, 
     get_training_status,
     get_sleep_data,
-    load_garmin_data
+    load_garmin_data,
+    GARMIN_CACHE_FILE,
+    UNIFIED_CACHE_FILE
 )
 from utils.metrics import FLOOR_THRESHOLD, YELLOW_THRESHOLD
 
@@ -35,6 +37,11 @@ RHR_YELLOW = 5  # bpm above baseline = yellow
 RHR_RED = 8  # bpm above baseline = red
 SLEEP_TARGET = 7.5  # hours
 DEEP_SLEEP_TARGET = 15  # percent
+SLEEP_WINDOW_DAYS = 14  # Nights shown/used on this page (charts need 2 weeks, averages 7 days)
+SLEEP_INT_COLUMNS = [
+    'sleep_seconds', 'deep_sleep_seconds', 'light_sleep_seconds',
+    'rem_sleep_seconds', 'awake_seconds', 'sleep_score'
+]
 
 # Dynamic baseline calculation
 def get_max_hr_from_activities(df):
@@ -43,13 +50,14 @@ def get_max_hr_from_activities(df):
         return 197  # Fallback default
     
     # Filter to last 12 months for current fitness relevance
-    cutoff_date = datetime.now() - timedelta(days=365)
-    recent_df = df[df['date'] >= cutoff_date]
+    cutoff = np.datetime64(datetime.now() - timedelta(days=365), 'ns')
+    recent_mask = df['date'].to_numpy() >= cutoff
+    max_hr_values = df['max_hr']
     
-    if recent_df.empty:
-        max_hr = df['max_hr'].max()  # Fall back to all data if no recent
+    if not recent_mask.any():
+        max_hr = max_hr_values.max()  # Fall back to all data if no recent
     else:
-        max_hr = recent_df['max_hr'].max()
+        max_hr = max_hr_values[recent_mask].max()
     
     return int(max_hr) if pd.notna(max_hr) and max_hr > 0 else 197
 
@@ -60,30 +68,297 @@ def get_baseline_rhr(training_status):
         return rhr_7d
     return 59  # Fallback to Jan 2026 baseline
 
+# Bar colors for the weekly status categories (data_loader.STATUS_CATEGORIES)
+STATUS_BAR_COLORS = {'RED': '#e74c3c', 'YELLOW': '#f39c12', 'GREEN': '#2ecc71'}
+STATUS_DEFAULT_COLOR = '#e74c3c'  # Unknown status shows as red
+
+# HR zones in bin order; the trailing gray catches code -1 (no zone)
+HR_ZONE_LABELS = ['Z1 Recovery', 'Z2 Easy', 'Z3 Tempo', 'Z4 Threshold', 'Z5 Max']
+HR_ZONE_PALETTE = np.array(['#3498db', '#2ecc71', '#f39c12', '#e74c3c', '#9b59b6', 'gray'])
+
+def _color_by_threshold(values, low, high, colors=('#e74c3c', '#f39c12', '#2ecc71')):
+    """Red below low, amber below high, green at or above high"""
+    values = np.asarray(values, dtype=float)
+    return np.select([values >= high, values >= low], [colors[2], colors[1]], default=colors[0]).tolist()
+
+# Chart builders - cached on hashable inputs and returned as plain Plotly
+# dicts, so reruns skip both trace construction and go.Figure validation
+@st.cache_data(ttl=300)
+def build_sleep_fig(dates, sleep_hours):
+    """Sleep duration bars with target line"""
+    fig_sleep = go.Figure()
+    
+    # Add sleep hours bars
+    colors = _color_by_threshold(sleep_hours, 6, SLEEP_TARGET)
+    
+    fig_sleep.add_trace(go.Bar(
+        x=list(dates),
+        y=list(sleep_hours),
+        marker_color=colors,
+        name='Sleep Duration',
+        text=[f"{h:.1f}h" for h in sleep_hours],
+        textposition='outside'
+    ))
+    
+    # Add target line
+    fig_sleep.add_hline(
+        y=SLEEP_TARGET, 
+        line_dash="dash", 
+        line_color="green",
+        annotation_text=f"Target: {SLEEP_TARGET}h",
+        annotation_position="right"
+    )
+    
+    fig_sleep.update_layout(
+        title="Sleep Duration (Last 14 Days)",
+        xaxis_title="Date",
+        yaxis_title="Hours",
+        yaxis_range=[0, 10],
+        showlegend=False,
+        height=350
+    )
+    return fig_sleep.to_dict()
+
+@st.cache_data(ttl=300)
+def build_deep_sleep_fig(dates, deep_pcts):
+    """Deep sleep percentage bars with target line"""
+    fig_deep = go.Figure()
+    
+    colors_deep = _color_by_threshold(deep_pcts, 10, DEEP_SLEEP_TARGET)
+    
+    fig_deep.add_trace(go.Bar(
+        x=list(dates),
+        y=list(deep_pcts),
+        marker_color=colors_deep,
+        name='Deep Sleep %',
+        text=[f"{p:.0f}%" for p in deep_pcts],
+        textposition='outside'
+    ))
+    
+    # Add target line
+    fig_deep.add_hline(
+        y=DEEP_SLEEP_TARGET, 
+        line_dash="dash", 
+        line_color="green",
+        annotation_text=f"Target: {DEEP_SLEEP_TARGET}%",
+        annotation_position="right"
+    )
+    
+    fig_deep.update_layout(
+        title="Deep Sleep % (Last 14 Days)",
+        xaxis_title="Date",
+        yaxis_title="Percentage",
+        yaxis_range=[0, 30],
+        showlegend=False,
+        height=350
+    )
+    return fig_deep.to_dict()
+
+@st.cache_data(ttl=300)
+def build_volume_fig(week_keys, distances, statuses):
+    """Weekly volume bars colored by floor status"""
+    fig_volume = go.Figure()
+    
+    # Color by status
+    colors_vol = [STATUS_BAR_COLORS.get(s, STATUS_DEFAULT_COLOR) for s in statuses]
+    
+    fig_volume.add_trace(go.Bar(
+        x=list(week_keys),
+        y=list(distances),
+        marker_color=colors_vol,
+        name='Volume',
+        text=[f"{d:.0f}km" for d in distances],
+        textposition='outside'
+    ))
+    
+    # Add floor threshold
+    fig_volume.add_hline(
+        y=FLOOR_THRESHOLD, 
+        line_dash="dash", 
+        line_color="red",
+        annotation_text=f"Floor: {FLOOR_THRESHOLD}km",
+        annotation_position="right"
+    )
+    
+    fig_volume.update_layout(
+        title="Weekly Volume (Last 12 Weeks)",
+        xaxis_title="Week",
+        yaxis_title="Distance (km)",
+        showlegend=False,
+        height=400
+    )
+    return fig_volume.to_dict()
+
+@st.cache_data(ttl=300)
+def build_load_fig(week_keys, loads):
+    """Weekly load proxy line with average"""
+    fig_load = go.Figure()
+    
+    # WebGL trace keeps rendering cheap as the number of weeks grows
+    fig_load.add_trace(go.Scattergl(
+        x=list(week_keys),
+        y=list(loads),
+        mode='lines+markers',
+        name='Training Load',
+        line=dict(color='#3498db', width=3),
+        marker=dict(size=10)
+    ))
+    
+    # Add average line
+    avg_load = sum(loads) / len(loads)
+    fig_load.add_hline(
+        y=avg_load, 
+        line_dash="dash", 
+        line_color="gray",
+        annotation_text=f"Avg: {avg_load:.0f}",
+        annotation_position="right"
+    )
+    
+    fig_load.update_layout(
+        title="Estimated Training Load (Volume × Intensity)",
+        xaxis_title="Week",
+        yaxis_title="Load Units",
+        showlegend=False,
+        height=400
+    )
+    return fig_load.to_dict()
+
+@st.cache_data(ttl=300)
+def build_hr_fig(dates, avg_hrs, distances, colors_hr, hover_texts, z1_max, z2_max, z3_max):
+    """Average HR per activity, sized by distance, with zone lines"""
+    fig_hr = go.Figure()
+    
+    # WebGL rather than SVG so marker count doesn't stall the browser
+    fig_hr.add_trace(go.Scattergl(
+        x=list(dates),
+        y=list(avg_hrs),
+        mode='markers',
+        marker=dict(
+            size=[d * 2 for d in distances],  # Size by distance
+            color=list(colors_hr),
+            line=dict(width=1, color='white')
+        ),
+        text=list(hover_texts),
+        hoverinfo='text'
+    ))
+    
+    # Add zone lines
+    fig_hr.add_hline(y=z1_max, line_dash="dot", line_color="#2ecc71", annotation_text="Z2", annotation_position="left")
+    fig_hr.add_hline(y=z2_max, line_dash="dot", line_color="#f39c12", annotation_text="Z3", annotation_position="left")
+    fig_hr.add_hline(y=z3_max, line_dash="dot", line_color="#e74c3c", annotation_text="Z4", annotation_position="left")
+    
+    fig_hr.update_layout(
+        title="Average HR by Activity (Last 20 Runs)",
+        xaxis_title="Date",
+        yaxis_title="Avg HR (bpm)",
+        yaxis_range=[100, 180],
+        showlegend=False,
+        height=400
+    )
+    return fig_hr.to_dict()
+
+# Recommendation rules, checked in order - the first matching threshold wins.
+# RHR rules fire above the threshold (bpm over baseline), sleep rules below it (hours).
+RHR_RULES = [
+    (RHR_RED, "🔴", "**RHR elevated by {value} bpm** - Consider rest day or very easy running"),
+    (RHR_YELLOW, "🟡", "**RHR elevated by {value} bpm** - Monitor fatigue, consider easier intensity"),
+]
+SLEEP_RULES = [
+    (6, "🔴", "**Sleep averaging {value:.1f}h** - Prioritize sleep before training"),
+    (SLEEP_TARGET, "🟡", "**Sleep averaging {value:.1f}h** - Try to get {target}h+ per night"),
+]
+TRAINING_STATUS_RULES = {
+    'Unproductive': ("🔴", "Review load and recovery balance"),
+    'Detraining': ("🔴", "Review load and recovery balance"),
+    'Overreaching': ("🔴", "Review load and recovery balance"),
+    'Maintaining': ("🟡", "Consistency is key, may need load adjustment"),
+    'Recovery': ("🟡", "Consistency is key, may need load adjustment"),
+}
+STATUS_SEVERITY = {"🟢": 0, "🟡": 1, "🔴": 2}
+
+@st.cache_data(ttl=300)
+def build_recommendations(rhr_7d, baseline_rhr, status_label, avg_sleep):
+    """Return (overall status icon, recommendation lines); avg_sleep is None without sleep data"""
+    flagged = []  # (icon, message)
+    
+    # Check RHR
+    if rhr_7d:
+        rhr_delta = rhr_7d - baseline_rhr
+        hit = next((r for r in RHR_RULES if rhr_delta > r[0]), None)
+        if hit:
+            flagged.append((hit[1], hit[2].format(value=rhr_delta)))
+    
+    # Check Training Status
+    if status_label in TRAINING_STATUS_RULES:
+        icon, advice = TRAINING_STATUS_RULES[status_label]
+        flagged.append((icon, f"**Training Status: {status_label}** - {advice}"))
+    
+    # Check Sleep
+    if avg_sleep is not None:
+        hit = next((r for r in SLEEP_RULES if avg_sleep < r[0]), None)
+        if hit:
+            flagged.append((hit[1], hit[2].format(value=avg_sleep, target=SLEEP_TARGET)))
+    
+    status_overall = max((icon for icon, _ in flagged), key=STATUS_SEVERITY.get, default="🟢")
+    return status_overall, [f"{icon} {message}" for icon, message in flagged]
+
+@st.cache_data(ttl=300)
+def baselines_markdown(max_hr, baseline_rhr):
+    """Sidebar baseline summary - only changes when the baselines do"""
+    return "\n\n".join([
+        "### Current Baselines",
+        f"**Max HR:** {max_hr} bpm",
+        f"**RHR Baseline:** {baseline_rhr} bpm",
+    ])
+
 # Load data
-def load_all_data():
-    """Load all data sources for training load analysis"""
+@st.cache_data(ttl=300, show_spinner=False)  # Cache for 5 minutes to avoid pickle issues
+def load_all_data(data_mtimes):
+    """Load all data sources for training load analysis (data_mtimes is part of the cache key)"""
     df = activities_to_dataframe()
     weekly = get_weekly_summary(df)
     training_status = get_training_status()
-    sleep_data = get_sleep_data()
-    return df, weekly, training_status, sleep_data
+    # Build the sleep frame once; the recovery, recommendation and debug
+    # sections all read from it
+    sleep_df = pd.DataFrame(get_sleep_data(limit=SLEEP_WINDOW_DAYS))
+    if not sleep_df.empty:
+        # Second counts fit in small ints; nights with missing values stay float
+        for col in SLEEP_INT_COLUMNS:
+            if col in sleep_df:
+                sleep_df[col] = pd.to_numeric(sleep_df[col], downcast='integer')
+        sleep_df['date'] = pd.to_datetime(sleep_df['date'])  # Already oldest first
+        # Calculate deep sleep percentage
+        total = sleep_df['sleep_seconds'].to_numpy(dtype=float)
+        deep = sleep_df['deep_sleep_seconds'].to_numpy(dtype=float)
+        sleep_df['deep_pct'] = np.round(deep * (100.0 / total), 1)
+    # Dynamic baselines only change when the data does, so cache them too
+    max_hr = get_max_hr_from_activities(df)
+    baseline_rhr = get_baseline_rhr(training_status)
+    return df, weekly, training_status, sleep_df, max_hr, baseline_rhr
+
+if st.sidebar.button("Refresh data"):
+    load_all_data.clear()
 
 try:
-    df, weekly, training_status, sleep_data = load_all_data()
-    
-    # Calculate dynamic baselines from actual data
-    MAX_HR = get_max_hr_from_activities(df)
-    BASELINE_RHR = get_baseline_rhr(training_status)
+    # Cache file mtimes key the loader, so a fresh sync invalidates it immediately
+    data_mtimes = tuple(p.stat().st_mtime if p.exists() else 0 for p in (GARMIN_CACHE_FILE, UNIFIED_CACHE_FILE))
+    # Dynamic baselines are calculated from actual data inside the loader
+    df, weekly, training_status, sleep_df, MAX_HR, BASELINE_RHR = load_all_data(data_mtimes)
     
     if df.empty:
         st.error("No running activities found. Run `python scripts/incremental-sync.py --days 90` to sync data.")
         st.stop()
 
+    # Last 7 nights and their averages, shared by the recovery, recommendation
+    # and debug sections
+    last_7 = sleep_df.tail(7)
+    avg_sleep_7d = avg_deep_7d = None
+    if not last_7.empty:
+        avg_sleep_7d = float(np.nanmean(last_7['sleep_hours'].to_numpy())) if 'sleep_hours' in last_7 else 0
+        avg_deep_7d = float(np.nanmean(last_7['deep_pct'].to_numpy()))
+
     # Show dynamic baselines in sidebar
-    st.sidebar.markdown("### Current Baselines")
-    st.sidebar.markdown(f"**Max HR:** {MAX_HR} bpm")
-    st.sidebar.markdown(f"**RHR Baseline:** {BASELINE_RHR} bpm")
+    st.sidebar.markdown(baselines_markdown(MAX_HR, BASELINE_RHR))
     st.sidebar.caption("_Auto-calculated from your data. New max HR efforts will update zones automatically._")
 
     # ============================================
@@ -91,62 +366,46 @@ try:
     # ============================================
     st.subheader("Current Training Status")
     
-    col1, col2, col3, col4 = st.columns(4)
+    vo2max = training_status.get('vo2max', 0)
+    load_7d = training_status.get('training_load_7d', 0)
     
-    with col1:
-        vo2max = training_status.get('vo2max', 0)
-        vo2max_display = f"{vo2max}" if vo2max else "N/A"
-        st.metric(
-            "VO2max", 
-            vo2max_display,
-            help="Garmin's estimated VO2max. Target: 43+ for sub-2:00 HM"
-        )
+    rhr = training_status.get('resting_hr', 0)
+    rhr_7d = training_status.get('resting_hr_7d_avg', BASELINE_RHR)
+    if rhr and rhr_7d:
+        delta = rhr - BASELINE_RHR
+        delta_display = f"{delta:+.0f} vs baseline"
+        delta_color = "inverse" if delta > 0 else "normal"
+    else:
+        delta_display = None
+        delta_color = "off"
     
-    with col2:
-        load_7d = training_status.get('training_load_7d', 0)
-        load_display = f"{load_7d}" if load_7d else "N/A"
-        st.metric(
-            "7-Day Load",
-            load_display,
-            help="Garmin's Training Load (acute stress). Higher = more recent stress."
-        )
+    status_label = training_status.get('training_effect_label', 'Unknown')
+    # Color code the status
+    status_colors = {
+        'Productive': '🟢',
+        'Peaking': '🟢',
+        'Maintaining': '🟡',
+        'Recovery': '🟡',
+        'Unproductive': '🔴',
+        'Detraining': '🔴',
+        'Overreaching': '🔴'
+    }
+    status_icon = status_colors.get(status_label, '⚪')
     
-    with col3:
-        rhr = training_status.get('resting_hr', 0)
-        rhr_7d = training_status.get('resting_hr_7d_avg', BASELINE_RHR)
-        if rhr and rhr_7d:
-            delta = rhr - BASELINE_RHR
-            delta_display = f"{delta:+.0f} vs baseline"
-            delta_color = "inverse" if delta > 0 else "normal"
-        else:
-            delta_display = None
-            delta_color = "off"
-        st.metric(
-            "Resting HR",
-            f"{rhr_7d} bpm" if rhr_7d else "N/A",
-            delta=delta_display,
-            delta_color=delta_color,
-            help=f"7-day avg RHR. Baseline: {BASELINE_RHR} bpm. Elevated RHR = fatigue/stress."
-        )
+    # (label, value, delta, delta_color, help)
+    status_cards = [
+        ("VO2max", f"{vo2max}" if vo2max else "N/A", None, "normal",
+         "Garmin's estimated VO2max. Target: 43+ for sub-2:00 HM"),
+        ("7-Day Load", f"{load_7d}" if load_7d else "N/A", None, "normal",
+         "Garmin's Training Load (acute stress). Higher = more recent stress."),
+        ("Resting HR", f"{rhr_7d} bpm" if rhr_7d else "N/A", delta_display, delta_color,
+         f"7-day avg RHR. Baseline: {BASELINE_RHR} bpm. Elevated RHR = fatigue/stress."),
+        ("Training Status", f"{status_icon} {status_label}", None, "normal",
+         "Garmin's assessment of training effectiveness"),
+    ]
     
-    with col4:
-        status_label = training_status.get('training_effect_label', 'Unknown')
-        # Color code the status
-        status_colors = {
-            'Productive': '🟢',
-            'Peaking': '🟢',
-            'Maintaining': '🟡',
-            'Recovery': '🟡',
-            'Unproductive': '🔴',
-            'Detraining': '🔴',
-            'Overreaching': '🔴'
-        }
-        status_icon = status_colors.get(status_label, '⚪')
-        st.metric(
-            "Training Status",
-            f"{status_icon} {status_label}",
-            help="Garmin's assessment of training effectiveness"
-        )
+    for col, (label, value, card_delta, color, help_text) in zip(st.columns(4), status_cards):
+        col.metric(label, value, delta=card_delta, delta_color=color, help=help_text)
 
     # ============================================
     # RECOVERY METRICS (Sleep & RHR)
@@ -154,104 +413,29 @@ try:
     st.markdown("---")
     st.subheader("Recovery Metrics")
     
-    if sleep_data:
-        # Process sleep data
-        sleep_df = pd.DataFrame(sleep_data)
-        sleep_df['date'] = pd.to_datetime(sleep_df['date'])
-        sleep_df = sleep_df.sort_values('date')
-        
-        # Calculate deep sleep percentage
-        sleep_df['deep_pct'] = (sleep_df['deep_sleep_seconds'] / sleep_df['sleep_seconds'] * 100).round(1)
-        
-        # Get last 7 days
-        last_7_days = sleep_df.tail(14)  # Show 2 weeks for context
+    if not sleep_df.empty:
+        # sleep_df is already the 2-week window shown for context
+        chart_dates = tuple(sleep_df['date'])
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Sleep duration trend
-            fig_sleep = go.Figure()
-            
-            # Add sleep hours bars
-            colors = ['#2ecc71' if h >= SLEEP_TARGET else '#f39c12' if h >= 6 else '#e74c3c' 
-                      for h in last_7_days['sleep_hours']]
-            
-            fig_sleep.add_trace(go.Bar(
-                x=last_7_days['date'],
-                y=last_7_days['sleep_hours'],
-                marker_color=colors,
-                name='Sleep Duration',
-                text=[f"{h:.1f}h" for h in last_7_days['sleep_hours']],
-                textposition='outside'
-            ))
-            
-            # Add target line
-            fig_sleep.add_hline(
-                y=SLEEP_TARGET, 
-                line_dash="dash", 
-                line_color="green",
-                annotation_text=f"Target: {SLEEP_TARGET}h",
-                annotation_position="right"
-            )
-            
-            fig_sleep.update_layout(
-                title="Sleep Duration (Last 14 Days)",
-                xaxis_title="Date",
-                yaxis_title="Hours",
-                yaxis_range=[0, 10],
-                showlegend=False,
-                height=350
-            )
-            
+            fig_sleep = build_sleep_fig(chart_dates, tuple(sleep_df['sleep_hours']))
             st.plotly_chart(fig_sleep, use_container_width=True)
         
         with col2:
             # Deep sleep percentage trend
-            fig_deep = go.Figure()
-            
-            colors_deep = ['#2ecc71' if p >= DEEP_SLEEP_TARGET else '#f39c12' if p >= 10 else '#e74c3c' 
-                           for p in last_7_days['deep_pct']]
-            
-            fig_deep.add_trace(go.Bar(
-                x=last_7_days['date'],
-                y=last_7_days['deep_pct'],
-                marker_color=colors_deep,
-                name='Deep Sleep %',
-                text=[f"{p:.0f}%" for p in last_7_days['deep_pct']],
-                textposition='outside'
-            ))
-            
-            # Add target line
-            fig_deep.add_hline(
-                y=DEEP_SLEEP_TARGET, 
-                line_dash="dash", 
-                line_color="green",
-                annotation_text=f"Target: {DEEP_SLEEP_TARGET}%",
-                annotation_position="right"
-            )
-            
-            fig_deep.update_layout(
-                title="Deep Sleep % (Last 14 Days)",
-                xaxis_title="Date",
-                yaxis_title="Percentage",
-                yaxis_range=[0, 30],
-                showlegend=False,
-                height=350
-            )
-            
+            fig_deep = build_deep_sleep_fig(chart_dates, tuple(sleep_df['deep_pct']))
             st.plotly_chart(fig_deep, use_container_width=True)
         
         # Sleep summary stats
-        recent_sleep = sleep_df.tail(7)
-        avg_sleep = recent_sleep['sleep_hours'].mean()
-        avg_deep = recent_sleep['deep_pct'].mean()
-        
-        sleep_status = "🟢" if avg_sleep >= SLEEP_TARGET else "🟡" if avg_sleep >= 6 else "🔴"
-        deep_status = "🟢" if avg_deep >= DEEP_SLEEP_TARGET else "🟡" if avg_deep >= 10 else "🔴"
+        sleep_status = "🟢" if avg_sleep_7d >= SLEEP_TARGET else "🟡" if avg_sleep_7d >= 6 else "🔴"
+        deep_status = "🟢" if avg_deep_7d >= DEEP_SLEEP_TARGET else "🟡" if avg_deep_7d >= 10 else "🔴"
         
         st.markdown(f"""
-        **7-Day Averages:** {sleep_status} Sleep: **{avg_sleep:.1f}h** (target: {SLEEP_TARGET}h) | 
-        {deep_status} Deep Sleep: **{avg_deep:.1f}%** (target: {DEEP_SLEEP_TARGET}%)
+        **7-Day Averages:** {sleep_status} Sleep: **{avg_sleep_7d:.1f}h** (target: {SLEEP_TARGET}h) | 
+        {deep_status} Deep Sleep: **{avg_deep_7d:.1f}%** (target: {DEEP_SLEEP_TARGET}%)
         """)
     else:
         st.info("No sleep data available. Sync from Garmin to see recovery metrics.")
@@ -269,92 +453,36 @@ try:
     if not weekly_for_load.empty:
         # Create a simple load proxy: distance × (avg_hr / 150) as intensity factor
         # Higher HR sessions count more
-        weekly_for_load['load_proxy'] = weekly_for_load.apply(
-            lambda row: row['distance_km'] * (row['avg_hr'] / 150 if pd.notna(row['avg_hr']) and row['avg_hr'] > 0 else 1),
-            axis=1
-        ).round(0)
+        hr = weekly_for_load['avg_hr'].to_numpy(dtype=float)
+        dist = weekly_for_load['distance_km'].to_numpy(dtype=float)
+        factor = np.where(np.isnan(hr) | (hr <= 0), 1.0, hr / 150.0)
+        weekly_for_load['load_proxy'] = np.round(dist * factor)
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Volume trend
-            fig_volume = go.Figure()
-            
-            # Color by status
-            colors_vol = ['#2ecc71' if s == 'GREEN' else '#f39c12' if s == 'YELLOW' else '#e74c3c' 
-                          for s in weekly_for_load['status']]
-            
-            fig_volume.add_trace(go.Bar(
-                x=weekly_for_load['week_key'],
-                y=weekly_for_load['distance_km'],
-                marker_color=colors_vol,
-                name='Volume',
-                text=[f"{d:.0f}km" for d in weekly_for_load['distance_km']],
-                textposition='outside'
-            ))
-            
-            # Add floor threshold
-            fig_volume.add_hline(
-                y=FLOOR_THRESHOLD, 
-                line_dash="dash", 
-                line_color="red",
-                annotation_text=f"Floor: {FLOOR_THRESHOLD}km",
-                annotation_position="right"
+            fig_volume = build_volume_fig(
+                tuple(weekly_for_load['week_key']),
+                tuple(weekly_for_load['distance_km']),
+                tuple(weekly_for_load['status'])
             )
-            
-            fig_volume.update_layout(
-                title="Weekly Volume (Last 12 Weeks)",
-                xaxis_title="Week",
-                yaxis_title="Distance (km)",
-                showlegend=False,
-                height=400
-            )
-            
             st.plotly_chart(fig_volume, use_container_width=True)
         
         with col2:
             # Load proxy trend
-            fig_load = go.Figure()
-            
-            fig_load.add_trace(go.Scatter(
-                x=weekly_for_load['week_key'],
-                y=weekly_for_load['load_proxy'],
-                mode='lines+markers',
-                name='Training Load',
-                line=dict(color='#3498db', width=3),
-                marker=dict(size=10)
-            ))
-            
-            # Add average line
-            avg_load = weekly_for_load['load_proxy'].mean()
-            fig_load.add_hline(
-                y=avg_load, 
-                line_dash="dash", 
-                line_color="gray",
-                annotation_text=f"Avg: {avg_load:.0f}",
-                annotation_position="right"
-            )
-            
-            fig_load.update_layout(
-                title="Estimated Training Load (Volume × Intensity)",
-                xaxis_title="Week",
-                yaxis_title="Load Units",
-                showlegend=False,
-                height=400
-            )
-            
+            fig_load = build_load_fig(tuple(weekly_for_load['week_key']), tuple(weekly_for_load['load_proxy']))
             st.plotly_chart(fig_load, use_container_width=True)
         
         # Week-over-week change
         if len(weekly_for_load) >= 2:
-            current_week = weekly_for_load.iloc[-1]
-            prev_week = weekly_for_load.iloc[-2]
+            last_two = weekly_for_load[['distance_km', 'load_proxy']].iloc[-2:]
+            diffs = last_two.diff().iloc[-1]
+            # A zero previous week gives inf/NaN - show 0% as before
+            wow = last_two.pct_change().iloc[-1].replace([np.inf, -np.inf], np.nan).fillna(0) * 100
             
-            vol_change = current_week['distance_km'] - prev_week['distance_km']
-            vol_pct = (vol_change / prev_week['distance_km'] * 100) if prev_week['distance_km'] > 0 else 0
-            
-            load_change = current_week['load_proxy'] - prev_week['load_proxy']
-            load_pct = (load_change / prev_week['load_proxy'] * 100) if prev_week['load_proxy'] > 0 else 0
+            vol_change, vol_pct = diffs['distance_km'], wow['distance_km']
+            load_change, load_pct = diffs['load_proxy'], wow['load_proxy']
             
             st.markdown(f"""
             **Week-over-Week Change:** 
@@ -369,8 +497,7 @@ try:
     st.subheader("Heart Rate Analysis")
     
     # Get recent activities with HR data
-    recent_activities = df.tail(20).copy()
-    recent_with_hr = recent_activities[recent_activities['avg_hr'].notna()].copy()
+    recent_with_hr = df.loc[df['avg_hr'].notna()].tail(20)
     
     if not recent_with_hr.empty:
         # Calculate dynamic zone thresholds based on MAX_HR
@@ -379,55 +506,27 @@ try:
         z3_max = int(MAX_HR * 0.80)  # 80% of max
         z4_max = int(MAX_HR * 0.90)  # 90% of max
         
-        # Avg HR by activity
-        fig_hr = go.Figure()
-        
-        # Define HR zones dynamically
-        def get_hr_zone(hr):
-            if hr < z1_max: return 'Z1 Recovery'
-            elif hr < z2_max: return 'Z2 Easy'
-            elif hr < z3_max: return 'Z3 Tempo'
-            elif hr < z4_max: return 'Z4 Threshold'
-            else: return 'Z5 Max'
-        
-        recent_with_hr['hr_zone'] = recent_with_hr['avg_hr'].apply(get_hr_zone)
-        
-        # Color by zone
-        zone_colors = {
-            'Z1 Recovery': '#3498db',
-            'Z2 Easy': '#2ecc71',
-            'Z3 Tempo': '#f39c12',
-            'Z4 Threshold': '#e74c3c',
-            'Z5 Max': '#9b59b6'
-        }
-        colors_hr = [zone_colors.get(z, 'gray') for z in recent_with_hr['hr_zone']]
-        
-        fig_hr.add_trace(go.Scatter(
-            x=recent_with_hr['date'],
-            y=recent_with_hr['avg_hr'],
-            mode='markers',
-            marker=dict(
-                size=recent_with_hr['distance_km'] * 2,  # Size by distance
-                color=colors_hr,
-                line=dict(width=1, color='white')
-            ),
-            text=[f"{row['name']}<br>{row['distance_km']:.1f}km @ {row['avg_hr']:.0f}bpm" 
-                  for _, row in recent_with_hr.iterrows()],
-            hoverinfo='text'
+        # Bin into HR zones dynamically (lower bound inclusive)
+        recent_with_hr = recent_with_hr.assign(hr_zone=pd.cut(
+            recent_with_hr['avg_hr'],
+            bins=[-np.inf, z1_max, z2_max, z3_max, z4_max, np.inf],
+            labels=HR_ZONE_LABELS,
+            right=False
         ))
         
-        # Add zone lines
-        fig_hr.add_hline(y=z1_max, line_dash="dot", line_color="#2ecc71", annotation_text="Z2", annotation_position="left")
-        fig_hr.add_hline(y=z2_max, line_dash="dot", line_color="#f39c12", annotation_text="Z3", annotation_position="left")
-        fig_hr.add_hline(y=z3_max, line_dash="dot", line_color="#e74c3c", annotation_text="Z4", annotation_position="left")
+        # Color by zone
+        colors_hr = HR_ZONE_PALETTE[recent_with_hr['hr_zone'].cat.codes.to_numpy()]
         
-        fig_hr.update_layout(
-            title="Average HR by Activity (Last 20 Runs)",
-            xaxis_title="Date",
-            yaxis_title="Avg HR (bpm)",
-            yaxis_range=[100, 180],
-            showlegend=False,
-            height=400
+        # Avg HR by activity
+        fig_hr = build_hr_fig(
+            tuple(recent_with_hr['date']),
+            tuple(recent_with_hr['avg_hr']),
+            tuple(recent_with_hr['distance_km']),
+            tuple(colors_hr),
+            tuple(recent_with_hr['name'].astype(str) + '<br>'
+                  + recent_with_hr['distance_km'].round(1).astype(str) + 'km @ '
+                  + recent_with_hr['avg_hr'].round(0).astype(int).astype(str) + 'bpm'),
+            z1_max, z2_max, z3_max
         )
         
         st.plotly_chart(fig_hr, use_container_width=True)
@@ -439,39 +538,12 @@ try:
     st.subheader("Recovery Assessment")
     
     # Build recommendations based on current data
-    recommendations = []
-    status_overall = "🟢"
-    
-    # Check RHR
-    rhr_7d = training_status.get('resting_hr_7d_avg', BASELINE_RHR)
-    if rhr_7d:
-        rhr_delta = rhr_7d - BASELINE_RHR
-        if rhr_delta > RHR_RED:
-            recommendations.append(f"🔴 **RHR elevated by {rhr_delta} bpm** - Consider rest day or very easy running")
-            status_overall = "🔴"
-        elif rhr_delta > RHR_YELLOW:
-            recommendations.append(f"🟡 **RHR elevated by {rhr_delta} bpm** - Monitor fatigue, consider easier intensity")
-            if status_overall != "🔴": status_overall = "🟡"
-    
-    # Check Training Status
-    status_label = training_status.get('training_effect_label', '')
-    if status_label in ['Unproductive', 'Detraining', 'Overreaching']:
-        recommendations.append(f"🔴 **Training Status: {status_label}** - Review load and recovery balance")
-        status_overall = "🔴"
-    elif status_label in ['Maintaining', 'Recovery']:
-        recommendations.append(f"🟡 **Training Status: {status_label}** - Consistency is key, may need load adjustment")
-        if status_overall != "🔴": status_overall = "🟡"
-    
-    # Check Sleep
-    if sleep_data:
-        recent_sleep = pd.DataFrame(sleep_data).tail(7)
-        avg_sleep = recent_sleep['sleep_hours'].mean() if 'sleep_hours' in recent_sleep else 0
-        if avg_sleep < 6:
-            recommendations.append(f"🔴 **Sleep averaging {avg_sleep:.1f}h** - Prioritize sleep before training")
-            status_overall = "🔴"
-        elif avg_sleep < SLEEP_TARGET:
-            recommendations.append(f"🟡 **Sleep averaging {avg_sleep:.1f}h** - Try to get {SLEEP_TARGET}h+ per night")
-            if status_overall != "🔴": status_overall = "🟡"
+    status_overall, recommendations = build_recommendations(
+        training_status.get('resting_hr_7d_avg', BASELINE_RHR),
+        BASELINE_RHR,
+        training_status.get('training_effect_label', ''),
+        avg_sleep_7d
+    )
     
     # Display overall status
     status_text = {
@@ -494,15 +566,16 @@ try:
     with st.expander("Debug: Raw Training Status Data"):
         st.json(training_status)
         
-        if sleep_data:
+        if not sleep_df.empty:
             st.markdown("**Recent Sleep Data (last 7 days):**")
-            recent_sleep_display = pd.DataFrame(sleep_data).tail(7)
+            recent_sleep_display = last_7[['date', 'sleep_hours', 'deep_sleep_seconds', 'sleep_seconds']]
             # Display as markdown table
-            st.markdown("| Date | Hours | Deep % |")
-            st.markdown("|------|-------|--------|")
-            for _, row in recent_sleep_display.iterrows():
-                deep_pct = (row['deep_sleep_seconds'] / row['sleep_seconds'] * 100) if row['sleep_seconds'] else 0
-                st.markdown(f"| {row['date']} | {row['sleep_hours']:.1f}h | {deep_pct:.0f}% |")
+            rows = ["| Date | Hours | Deep % |", "|------|-------|--------|"]
+            rows += [
+                f"| {d:%Y-%m-%d} | {h:.1f}h | {(deep / total * 100) if total else 0:.0f}% |"
+                for d, h, deep, total in recent_sleep_display.itertuples(index=False)
+            ]
+            st.markdown("\n".join(rows))
 
 except Exception as e:
     st.error(f"Error loading data: {e}")
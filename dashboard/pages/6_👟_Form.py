@@ -6,16 +6,20 @@ Track running form metrics: cadence, stride length, and form progress.
 
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
-from datetime import datetime, timedelta
+import numpy as np
 import sys
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from utils.data_loader import activities_to_dataframe, load_activities, get_cadence_pace_analysis
+from utils.data_loader import (
+    activities_to_dataframe,
+    load_activities,
+    GARMIN_CACHE_FILE,
+    UNIFIED_CACHE_FILE
+)
 
 # Page config
 st.set_page_config(page_title="Form Analysis", page_icon="👟", layout="wide")
@@ -29,138 +33,335 @@ CADENCE_TARGET_MIN = 155  # spm - steps per minute (your realistic range)
 CADENCE_TARGET_MAX = 170  # Aspirational upper target
 STRIDE_EFFICIENCY_THRESHOLD = 1.0  # meters - roughly bodyweight dependent
 
-def extract_lap_metrics(activities):
-    """Extract cadence and stride data from activity laps"""
-    lap_data = []
-    
-    for act in activities:
+# Pace brackets (min/km) and their target cadence ranges
+PACE_BRACKETS = {
+    'Fast': {'min': 0, 'max': 6.0, 'target': (162, 175)},
+    'Moderate': {'min': 6.0, 'max': 6.5, 'target': (158, 168)},
+    'Easy': {'min': 6.5, 'max': 7.0, 'target': (155, 165)},
+    'Recovery': {'min': 7.0, 'max': 10.0, 'target': (150, 160)},
+}
+
+# Whole-run pace brackets for the progress table: upper edges (min/km) and labels
+PROGRESS_BRACKET_EDGES = np.array([6.0, 6.5, 7.0])
+PROGRESS_BRACKET_LABELS = np.array([
+    "Fast (<6:00)", "Moderate (6:00-6:30)", "Easy (6:30-7:00)", "Recovery (>7:00)"
+])
+
+def load_form_activities():
+    """Load running activities only, with each lap list normalized once into `_laps`
+
+    Not st.cache_data: load_activities() is already memoized on the cache
+    file mtime, and a cache hit here would unpickle every activity per rerun.
+    """
+    running = []
+    for act in load_activities():
         if act.get('type') != 'running':
             continue
-            
-        splits = act.get('splits', {})
+        splits = act.get('splits')
         laps = splits.get('lapDTOs', []) if isinstance(splits, dict) else []
+        # Shallow copy: load_activities() returns the shared parsed cache
+        running.append({**act, '_laps': laps})
+    return running
+
+# Per-lap fields read from each lapDTO, with the default used when missing
+LAP_FIELDS = {
+    'cadence': ('averageRunCadence', None),
+    'stride_cm': ('strideLength', None),
+    'pace_ms': ('averageSpeed', 0),
+    'distance_m': ('distance', 0)
+}
+
+def flatten_running_laps(running):
+    """Split running activities into column arrays: one frame per activity, one per lap.
+
+    Every dict lookup happens here once; the extractors below only mask and
+    aggregate columns. `act_id` in the lap frame is the row of its activity.
+    """
+    acts = pd.DataFrame({
+        'date': [act.get('date', '') for act in running],
+        'name': [act.get('name', 'Unknown') for act in running],
+        'distance_km': [act.get('distance_km', 0) for act in running],
+        'avg_hr': [act.get('avg_hr', 0) for act in running],
+        'avg_pace': [act.get('avg_pace_min_km', '') for act in running]
+    })
+    laps = pd.DataFrame(
+        [
+            (i, *(lap.get(key, default) for key, default in LAP_FIELDS.values()))
+            for i, act in enumerate(running)
+            for lap in act['_laps']
+        ],
+        columns=['act_id', *LAP_FIELDS]
+    )
+    return acts, laps
+
+def get_activity_averages(acts, laps):
+    """Get activity-level cadence and stride averages"""
+    laps = laps[laps['cadence'].fillna(0).ne(0) & laps['stride_cm'].fillna(0).ne(0)]
+    
+    # Distance-weighted means: sum(x * dist) / sum(dist) per activity
+    totals = laps.assign(
+        cw=laps['cadence'] * laps['distance_m'],
+        sw=laps['stride_cm'] * laps['distance_m']
+    ).groupby('act_id', sort=True)[['cw', 'sw', 'distance_m']].sum()
+    totals = totals[totals['distance_m'] > 0]
+    
+    owner = acts.iloc[totals.index]
+    return pd.DataFrame({
+        'date': owner['date'].to_numpy(),
+        'name': owner['name'].to_numpy(),
+        'distance_km': owner['distance_km'].to_numpy(),
+        'avg_cadence': (totals['cw'] / totals['distance_m']).to_numpy(),  # Already in steps per minute
+        'avg_stride_m': (totals['sw'] / totals['distance_m'] / 100).to_numpy(),  # Meters
+        'avg_hr': owner['avg_hr'].to_numpy(),
+        'avg_pace': owner['avg_pace'].to_numpy()
+    })
+
+def extract_bracket_laps(acts, laps):
+    """Laps with cadence and pace for the pace-bracket analysis, newest first"""
+    laps = laps[
+        laps['cadence'].fillna(0).ne(0) & (laps['pace_ms'] > 0) & (laps['distance_m'] >= 500)
+    ]
+    return pd.DataFrame({
+        'date': acts['date'].astype(str).str.slice(0, 10).to_numpy()[laps['act_id']],
+        'cadence': laps['cadence'].to_numpy(),
+        'pace_min_km': (1000 / laps['pace_ms'].to_numpy()) / 60
+    }).sort_values('date', ascending=False, kind='stable', ignore_index=True)
+
+def analyze_pace_brackets(laps_df):
+    """Recent 5 vs previous 5 lap cadence per pace bracket (laps_df is newest first)"""
+    bracket_analysis = {}
+    
+    for bracket_name, bracket_config in PACE_BRACKETS.items():
+        # Filter laps in this bracket
+        bracket_laps = laps_df[
+            (laps_df['pace_min_km'] >= bracket_config['min']) &
+            (laps_df['pace_min_km'] < bracket_config['max'])
+        ]
         
-        act_date = act.get('date', '')
-        act_name = act.get('name', 'Unknown')
-        act_distance = act.get('distance_km', 0)
-        
-        for lap in laps:
-            cadence = lap.get('averageRunCadence')
-            stride = lap.get('strideLength')
-            pace = lap.get('averageSpeed', 0)  # m/s
-            hr = lap.get('averageHR')
-            distance = lap.get('distance', 0) / 1000  # Convert to km
+        if len(bracket_laps) >= 3:
+            # Recent 5 laps vs previous 5 laps
+            recent_laps = bracket_laps.iloc[:5]
+            previous_laps = bracket_laps.iloc[5:10]
             
-            if cadence and stride and distance >= 0.5:  # Only include substantial laps
-                lap_data.append({
-                    'date': act_date,
-                    'activity_name': act_name,
-                    'activity_distance': act_distance,
-                    'lap_index': lap.get('lapIndex', 0),
-                    'cadence': cadence,  # Already in steps per minute
-                    'stride_m': stride / 100,  # Convert cm to m
-                    'pace_ms': pace,
-                    'pace_min_km': (1000 / pace / 60) if pace > 0 else 0,
-                    'avg_hr': hr,
-                    'distance_km': distance
-                })
-    
-    return pd.DataFrame(lap_data)
-
-def get_activity_averages(activities):
-    """Get activity-level cadence and stride averages"""
-    act_data = []
-    
-    for act in activities:
-        if act.get('type') != 'running':
-            continue
+            recent_avg = recent_laps['cadence'].mean()
+            previous_avg = previous_laps['cadence'].mean() if not previous_laps.empty else recent_avg
             
-        splits = act.get('splits', {})
-        laps = splits.get('lapDTOs', []) if isinstance(splits, dict) else []
-        
-        if not laps:
-            continue
-        
-        # Calculate weighted averages
-        total_distance = 0
-        weighted_cadence = 0
-        weighted_stride = 0
-        
-        for lap in laps:
-            dist = lap.get('distance', 0)
-            cadence = lap.get('averageRunCadence', 0)
-            stride = lap.get('strideLength', 0)
+            trend = recent_avg - previous_avg
+            target_min, target_max = bracket_config['target']
             
-            if cadence and stride:
-                weighted_cadence += cadence * dist
-                weighted_stride += stride * dist
-                total_distance += dist
-        
-        if total_distance > 0:
-            act_data.append({
-                'date': act.get('date', ''),
-                'name': act.get('name', 'Unknown'),
-                'distance_km': act.get('distance_km', 0),
-                'avg_cadence': weighted_cadence / total_distance,  # Already in steps per minute
-                'avg_stride_m': (weighted_stride / total_distance) / 100,  # Meters
-                'avg_hr': act.get('avg_hr', 0),
-                'avg_pace': act.get('avg_pace_min_km', '')
-            })
-    
-    return pd.DataFrame(act_data)
+            # Status
+            if target_min <= recent_avg <= target_max:
+                status = '✅ Good'
+            elif recent_avg < target_min:
+                status = '⚠️ Low'
+            else:
+                status = '🔵 High'
+            
+            # Trend indicator
+            if trend > 2:
+                trend_icon = '📈'
+                trend_text = f'+{trend:.0f}'
+            elif trend < -2:
+                trend_icon = '📉'
+                trend_text = f'{trend:.0f}'
+            else:
+                trend_icon = '➡️'
+                trend_text = '~'
+            
+            bracket_analysis[bracket_name] = {
+                'recent_avg': recent_avg,
+                'previous_avg': previous_avg,
+                'trend': trend,
+                'trend_icon': trend_icon,
+                'trend_text': trend_text,
+                'status': status,
+                'target': bracket_config['target'],
+                'lap_count': len(recent_laps),
+                'total_laps': len(bracket_laps)
+            }
+    
+    return bracket_analysis
 
-try:
-    activities = load_activities()
-    df = activities_to_dataframe()
+@st.cache_data(ttl=300)
+def build_form_frames(data_mtimes):
+    """Build the activity frame and the pace-bracket summary (data_mtimes is part of the cache key)"""
+    acts, laps = flatten_running_laps(load_form_activities())
+    act_df = get_activity_averages(acts, laps)
     
-    if not activities or df.empty:
-        st.error("No running activities found. Run `python scripts/incremental-sync.py --days 90` to sync data.")
-        st.stop()
+    # Parse dates
+    if not act_df.empty:
+        act_df['date'] = pd.to_datetime(act_df['date'], format='ISO8601', cache=True)
+        act_df = act_df.sort_values('date')
+    
+    # None when no lap has cadence and pace, {} when no bracket has enough laps
+    laps_df = extract_bracket_laps(acts, laps)
+    bracket_analysis = analyze_pace_brackets(laps_df) if not laps_df.empty else None
+    
+    return act_df, bracket_analysis
 
-    # Extract metrics
-    lap_df = extract_lap_metrics(activities)
-    act_df = get_activity_averages(activities)
+@st.cache_data(ttl=300)
+def build_cadence_fig(dates, cadences):
+    """Per-run cadence with target zone and 5-run trend"""
+    fig_cadence = go.Figure()
     
-    if act_df.empty:
-        st.warning("No cadence/stride data found in activities. Make sure your watch records these metrics.")
-        st.stop()
+    # Cadence by activity
+    cad = np.asarray(cadences, dtype=float)
+    colors = np.where((cad >= CADENCE_TARGET_MIN) & (cad <= CADENCE_TARGET_MAX), '#2ecc71', '#f39c12')
     
-    # Parse dates
-    act_df['date'] = pd.to_datetime(act_df['date'])
-    act_df = act_df.sort_values('date')
+    # WebGL so "All Time" doesn't put one SVG node per run in the DOM
+    fig_cadence.add_trace(go.Scattergl(
+        x=list(dates),
+        y=cad,
+        mode='markers+lines',
+        name='Cadence',
+        line=dict(color='#3498db', width=2),
+        marker=dict(size=10, color=colors, line=dict(width=1, color='white')),
+        hovertemplate='%{x|%b %d}<br>%{y:.0f} spm<extra></extra>'
+    ))
+    
+    # Add trend line
+    if len(cad) >= 5:
+        trend = pd.Series(cad).rolling(5, min_periods=3).mean()
+        fig_cadence.add_trace(go.Scatter(
+            x=list(dates),
+            y=trend,
+            mode='lines',
+            name='5-run Trend',
+            line=dict(color='#e74c3c', width=2, dash='dash')
+        ))
     
-    if not lap_df.empty:
-        lap_df['date'] = pd.to_datetime(lap_df['date'])
-        lap_df = lap_df.sort_values('date')
+    fig_cadence.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Cadence (steps/min)",
+        yaxis_range=[140, 190],
+        height=400,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02),
+        # Target zone band and label, set with the rest of the layout
+        shapes=[dict(
+            type='rect', xref='x domain', yref='y',
+            x0=0, x1=1, y0=CADENCE_TARGET_MIN, y1=CADENCE_TARGET_MAX,
+            fillcolor="rgba(46, 204, 113, 0.1)", line_width=0
+        )],
+        annotations=[dict(
+            text="Target Zone", showarrow=False,
+            xref='x domain', yref='y', x=1, y=CADENCE_TARGET_MAX,
+            xanchor='right', yanchor='top'
+        )]
+    )
+    return fig_cadence.to_dict()
+
+@st.cache_data(ttl=300)
+def build_stride_fig(dates, strides, distances):
+    """Per-run stride length over distance bars"""
+    fig_stride = go.Figure()
+    
+    # Primary: stride length (WebGL, like the cadence markers)
+    fig_stride.add_trace(go.Scattergl(
+        x=list(dates),
+        y=list(strides),
+        mode='markers+lines',
+        name='Stride Length',
+        line=dict(color='#9b59b6', width=2),
+        marker=dict(size=8),
+        yaxis='y'
+    ))
+    
+    # Secondary: distance (to show context)
+    fig_stride.add_trace(go.Bar(
+        x=list(dates),
+        y=list(distances),
+        name='Distance',
+        marker_color='rgba(52, 152, 219, 0.3)',
+        yaxis='y2'
+    ))
+    
+    fig_stride.update_layout(
+        xaxis_title="Date",
+        yaxis=dict(
+            title="Stride Length (m)",
+            side='left',
+            range=[0.8, 1.3]
+        ),
+        yaxis2=dict(
+            title="Distance (km)",
+            side='right',
+            overlaying='y',
+            range=[0, 25]
+        ),
+        height=400,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02)
+    )
+    return fig_stride.to_dict()
 
-    # Sidebar filters
-    st.sidebar.header("Filters")
+@st.fragment
+def form_trends(act_df):
+    """Cadence and stride trend charts.
+
+    Runs as a fragment so changing the range only reruns these charts,
+    not the bracket analysis and progress tables.
+    """
+    # ============================================
+    # CADENCE TREND
+    # ============================================
+    st.markdown("---")
+    st.subheader("Cadence Trend")
+    
     range_options = {
         "Last 10 Runs": 10,
         "Last 20 Runs": 20,
         "Last 50 Runs": 50,
         "All Time": len(act_df)
     }
-    selected_range = st.sidebar.selectbox("View", list(range_options.keys()), index=1)
+    selected_range = st.selectbox("View", list(range_options.keys()), index=1)
     n_runs = range_options[selected_range]
     
     act_filtered = act_df.tail(n_runs)
 
+    fig_cadence = build_cadence_fig(tuple(act_filtered['date']), tuple(act_filtered['avg_cadence']))
+    st.plotly_chart(fig_cadence, use_container_width=True)
+
+    # ============================================
+    # STRIDE LENGTH ANALYSIS
+    # ============================================
+    st.markdown("---")
+    st.subheader("Stride Length Trend")
+    
+    fig_stride = build_stride_fig(
+        tuple(act_filtered['date']),
+        tuple(act_filtered['avg_stride_m']),
+        tuple(act_filtered['distance_km'])
+    )
+    st.plotly_chart(fig_stride, use_container_width=True)
+
+try:
+    activities = load_form_activities()
+    df = activities_to_dataframe()
+    
+    if not activities or df.empty:
+        st.error("No running activities found. Run `python scripts/incremental-sync.py --days 90` to sync data.")
+        st.stop()
+
+    # Extract metrics; cache file mtimes key the build, so a fresh sync rebuilds it
+    data_mtimes = tuple(p.stat().st_mtime if p.exists() else 0 for p in (GARMIN_CACHE_FILE, UNIFIED_CACHE_FILE))
+    act_df, bracket_analysis = build_form_frames(data_mtimes)
+    
+    if act_df.empty:
+        st.warning("No cadence/stride data found in activities. Make sure your watch records these metrics.")
+        st.stop()
+
     # ============================================
     # CURRENT FORM SUMMARY
     # ============================================
     st.subheader("Current Form Metrics")
     
-    # Calculate recent averages (last 5 runs)
-    recent = act_df.tail(5)
-    avg_cadence = recent['avg_cadence'].mean()
-    avg_stride = recent['avg_stride_m'].mean()
+    # 5-run rolling means: the last row covers the recent 5 runs,
+    # the row five back covers the 5 runs before them
+    rolling_means = act_df[['avg_cadence', 'avg_stride_m']].rolling(5, min_periods=1).mean()
+    avg_cadence, avg_stride = rolling_means.iloc[-1]
     
     # Compare to older runs (5-10 runs ago)
     if len(act_df) >= 10:
-        older = act_df.tail(10).head(5)
-        old_cadence = older['avg_cadence'].mean()
-        old_stride = older['avg_stride_m'].mean()
+        old_cadence, old_stride = rolling_means.iloc[-6]
         cadence_delta = avg_cadence - old_cadence
         stride_delta = avg_stride - old_stride
     else:
@@ -168,7 +369,10 @@ try:
         stride_delta = 0
     
     # Cadence consistency (coefficient of variation) - used in recommendations below
-    cv = (recent['avg_cadence'].std() / recent['avg_cadence'].mean() * 100) if avg_cadence > 0 else 0
+    # Sample std (ddof=1, as pandas) straight on the last five values
+    recent_cadence = act_df['avg_cadence'].to_numpy()[-5:]
+    recent_std = recent_cadence.std(ddof=1) if len(recent_cadence) > 1 else np.nan
+    cv = (recent_std / avg_cadence * 100) if avg_cadence > 0 else 0
 
     col1, col2, col3 = st.columns(3)
     
@@ -196,57 +400,9 @@ try:
         )
 
     # ============================================
-    # CADENCE TREND
+    # CADENCE & STRIDE TRENDS
     # ============================================
-    st.markdown("---")
-    st.subheader("Cadence Trend")
-    
-    fig_cadence = go.Figure()
-    
-    # Cadence by activity
-    colors = ['#2ecc71' if CADENCE_TARGET_MIN <= c <= CADENCE_TARGET_MAX else '#f39c12' 
-              for c in act_filtered['avg_cadence']]
-    
-    fig_cadence.add_trace(go.Scatter(
-        x=act_filtered['date'],
-        y=act_filtered['avg_cadence'],
-        mode='markers+lines',
-        name='Cadence',
-        line=dict(color='#3498db', width=2),
-        marker=dict(size=10, color=colors, line=dict(width=1, color='white')),
-        hovertemplate='%{x|%b %d}<br>%{y:.0f} spm<extra></extra>'
-    ))
-    
-    # Add target zone
-    fig_cadence.add_hrect(
-        y0=CADENCE_TARGET_MIN, y1=CADENCE_TARGET_MAX,
-        fillcolor="rgba(46, 204, 113, 0.1)",
-        line_width=0,
-        annotation_text="Target Zone",
-        annotation_position="top right"
-    )
-    
-    # Add trend line
-    if len(act_filtered) >= 5:
-        z = pd.Series(range(len(act_filtered)))
-        trend = act_filtered['avg_cadence'].rolling(5, min_periods=3).mean()
-        fig_cadence.add_trace(go.Scatter(
-            x=act_filtered['date'],
-            y=trend,
-            mode='lines',
-            name='5-run Trend',
-            line=dict(color='#e74c3c', width=2, dash='dash')
-        ))
-    
-    fig_cadence.update_layout(
-        xaxis_title="Date",
-        yaxis_title="Cadence (steps/min)",
-        yaxis_range=[140, 190],
-        height=400,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02)
-    )
-    
-    st.plotly_chart(fig_cadence, use_container_width=True)
+    form_trends(act_df)
 
     # ============================================
     # CADENCE BY PACE BRACKET (Simplified & Actionable)
@@ -255,101 +411,16 @@ try:
     st.subheader("Cadence by Pace Bracket")
     st.caption("Are you hitting target cadence at each pace? Compares last 5 vs previous 5 laps per bracket.")
     
-    # Define pace brackets and targets
-    pace_brackets = {
-        'Fast': {'min': 0, 'max': 6.0, 'target': (162, 175)},
-        'Moderate': {'min': 6.0, 'max': 6.5, 'target': (158, 168)},
-        'Easy': {'min': 6.5, 'max': 7.0, 'target': (155, 165)},
-        'Recovery': {'min': 7.0, 'max': 10.0, 'target': (150, 160)},
-    }
-    
-    # Extract lap data with dates for trend analysis
-    lap_data_with_dates = []
-    for act in activities:
-        if act.get('type') != 'running':
-            continue
-        
-        act_date = act.get('date', '')[:10]
-        splits = act.get('splits', {})
-        laps = splits.get('lapDTOs', []) if isinstance(splits, dict) else []
-        
-        for lap in laps:
-            cadence = lap.get('averageRunCadence')
-            pace_ms = lap.get('averageSpeed', 0)
-            distance = lap.get('distance', 0)
-            
-            if cadence and pace_ms > 0 and distance >= 500:
-                pace_min_km = (1000 / pace_ms) / 60
-                lap_data_with_dates.append({
-                    'date': act_date,
-                    'cadence': cadence,
-                    'pace_min_km': pace_min_km
-                })
-    
-    if lap_data_with_dates:
-        # Sort by date descending
-        lap_data_with_dates.sort(key=lambda x: x['date'], reverse=True)
-        
-        # Analyze each bracket
-        bracket_analysis = {}
-        
-        for bracket_name, bracket_config in pace_brackets.items():
-            # Filter laps in this bracket
-            bracket_laps = [
-                lap for lap in lap_data_with_dates
-                if bracket_config['min'] <= lap['pace_min_km'] < bracket_config['max']
-            ]
-            
-            if len(bracket_laps) >= 3:
-                # Recent 5 laps vs previous 5 laps
-                recent_laps = bracket_laps[:5]
-                previous_laps = bracket_laps[5:10] if len(bracket_laps) >= 10 else bracket_laps[5:]
-                
-                recent_avg = sum(l['cadence'] for l in recent_laps) / len(recent_laps)
-                previous_avg = sum(l['cadence'] for l in previous_laps) / len(previous_laps) if previous_laps else recent_avg
-                
-                trend = recent_avg - previous_avg
-                target_min, target_max = bracket_config['target']
-                
-                # Status
-                if target_min <= recent_avg <= target_max:
-                    status = '✅ Good'
-                elif recent_avg < target_min:
-                    status = '⚠️ Low'
-                else:
-                    status = '🔵 High'
-                
-                # Trend indicator
-                if trend > 2:
-                    trend_icon = '📈'
-                    trend_text = f'+{trend:.0f}'
-                elif trend < -2:
-                    trend_icon = '📉'
-                    trend_text = f'{trend:.0f}'
-                else:
-                    trend_icon = '➡️'
-                    trend_text = '~'
-                
-                bracket_analysis[bracket_name] = {
-                    'recent_avg': recent_avg,
-                    'previous_avg': previous_avg,
-                    'trend': trend,
-                    'trend_icon': trend_icon,
-                    'trend_text': trend_text,
-                    'status': status,
-                    'target': bracket_config['target'],
-                    'lap_count': len(recent_laps),
-                    'total_laps': len(bracket_laps)
-                }
-        
+    if bracket_analysis is not None:
         # Display as table
         if bracket_analysis:
-            st.markdown("| Pace | Recent (5) | Previous (5) | Trend | Target | Status |")
-            st.markdown("|------|------------|--------------|-------|--------|--------|")
-            
+            rows = [
+                "| Pace | Recent (5) | Previous (5) | Trend | Target | Status |",
+                "|------|------------|--------------|-------|--------|--------|"
+            ]
             for bracket_name, data in bracket_analysis.items():
                 prev_str = f"{data['previous_avg']:.0f}" if data['previous_avg'] != data['recent_avg'] else "—"
-                st.markdown(
+                rows.append(
                     f"| **{bracket_name}** | "
                     f"{data['recent_avg']:.0f} spm | "
                     f"{prev_str} spm | "
@@ -357,6 +428,7 @@ try:
                     f"{data['target'][0]}-{data['target'][1]} | "
                     f"{data['status']} |"
                 )
+            st.markdown("\n".join(rows))
             
             # Summary insight
             improving_brackets = [name for name, data in bracket_analysis.items() if data['trend'] > 2]
@@ -369,7 +441,7 @@ try:
             if declining_brackets:
                 st.warning(f"**Watch:** {', '.join(declining_brackets)} -- cadence dropping")
             if low_brackets and not improving_brackets:
-                st.info(f"**Tip:** Focus on maintaining {low_brackets[0]} cadence above {pace_brackets[low_brackets[0]]['target'][0]} spm")
+                st.info(f"**Tip:** Focus on maintaining {low_brackets[0]} cadence above {PACE_BRACKETS[low_brackets[0]]['target'][0]} spm")
             elif not improving_brackets and not declining_brackets and not low_brackets:
                 st.success("Cadence looking stable across all pace brackets")
             
@@ -391,9 +463,6 @@ try:
     # Build activity data with proper metrics
     progress_data = []
     for act in activities:
-        if act.get('type') != 'running':
-            continue
-        
         date = act.get('date', '')[:10]
         if date < '2026-01':  # Focus on recent season
             continue
@@ -413,7 +482,7 @@ try:
         pace_str = f"{pace_min}:{pace_s:02d}"
         
         # Get stride from splits
-        splits = act.get('splits', {}).get('lapDTOs', []) if isinstance(act.get('splits'), dict) else []
+        splits = act['_laps']
         if splits:
             strides = [s.get('strideLength', 0) for s in splits if s.get('strideLength')]
             stride_cm = sum(strides) / len(strides) if strides else 0
@@ -433,19 +502,9 @@ try:
     if progress_data:
         progress_df = pd.DataFrame(progress_data).sort_values('date', ascending=False)
         
-        # Calculate pace bracket for each run
-        def get_pace_bracket(pace_sec):
-            pace_min = pace_sec / 60
-            if pace_min < 6.0:
-                return "Fast (<6:00)"
-            elif pace_min < 6.5:
-                return "Moderate (6:00-6:30)"
-            elif pace_min < 7.0:
-                return "Easy (6:30-7:00)"
-            else:
-                return "Recovery (>7:00)"
-        
-        progress_df['pace_bracket'] = progress_df['pace_sec'].apply(get_pace_bracket)
+        # Calculate pace bracket for each run (a pace on an edge falls in the slower bracket)
+        bracket_idx = np.searchsorted(PROGRESS_BRACKET_EDGES, progress_df['pace_sec'].to_numpy() / 60, side='right')
+        progress_df['pace_bracket'] = PROGRESS_BRACKET_LABELS[bracket_idx]
         
         # Find the most recent run for comparison
         most_recent = progress_df.iloc[0]
@@ -470,7 +529,8 @@ try:
             
             if len(similar_runs) > 0:
                 avg_cad = similar_runs['cadence'].mean()
-                avg_stride = similar_runs[similar_runs['stride_cm'] > 0]['stride_cm'].mean() if len(similar_runs[similar_runs['stride_cm'] > 0]) > 0 else 0
+                similar_strides = similar_runs.loc[similar_runs['stride_cm'] > 0, 'stride_cm']
+                avg_stride = similar_strides.mean() if not similar_strides.empty else 0
                 
                 cad_diff = most_recent['cadence'] - avg_cad
                 stride_diff = most_recent['stride_cm'] - avg_stride if avg_stride > 0 and most_recent['stride_cm'] > 0 else 0
@@ -506,7 +566,7 @@ try:
             st.markdown("Recent runs with cadence and stride data:")
             
             # Format as markdown table instead of st.dataframe (avoids pyarrow dependency)
-            display_df = progress_df.head(15)[['date', 'name', 'distance_km', 'pace', 'cadence', 'stride_cm', 'pace_bracket']].copy()
+            display_df = progress_df.iloc[:15]
             
             st.markdown("| Date | Run | Dist | Pace | Cadence | Stride | Bracket |")
             st.markdown("|------|-----|------|------|---------|--------|---------|")
@@ -514,53 +574,6 @@ try:
                 stride_str = f"{row['stride_cm']:.0f} cm" if row['stride_cm'] > 0 else "N/A"
                 st.markdown(f"| {row['date']} | {row['name'][:25]} | {row['distance_km']:.1f}km | {row['pace']} | {row['cadence']:.0f} spm | {stride_str} | {row['pace_bracket'][:8]} |")
     
-    # ============================================
-    # STRIDE LENGTH ANALYSIS
-    # ============================================
-    st.markdown("---")
-    st.subheader("Stride Length Trend")
-    
-    fig_stride = go.Figure()
-    
-    # Primary: stride length
-    fig_stride.add_trace(go.Scatter(
-        x=act_filtered['date'],
-        y=act_filtered['avg_stride_m'],
-        mode='markers+lines',
-        name='Stride Length',
-        line=dict(color='#9b59b6', width=2),
-        marker=dict(size=8),
-        yaxis='y'
-    ))
-    
-    # Secondary: distance (to show context)
-    fig_stride.add_trace(go.Bar(
-        x=act_filtered['date'],
-        y=act_filtered['distance_km'],
-        name='Distance',
-        marker_color='rgba(52, 152, 219, 0.3)',
-        yaxis='y2'
-    ))
-    
-    fig_stride.update_layout(
-        xaxis_title="Date",
-        yaxis=dict(
-            title="Stride Length (m)",
-            side='left',
-            range=[0.8, 1.3]
-        ),
-        yaxis2=dict(
-            title="Distance (km)",
-            side='right',
-            overlaying='y',
-            range=[0, 25]
-        ),
-        height=400,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02)
-    )
-    
-    st.plotly_chart(fig_stride, use_container_width=True)
-
     # ============================================
     # FORM RECOMMENDATIONS
     # ============================================
@@ -581,12 +594,9 @@ try:
         recommendations.append(f"🟡 **Cadence inconsistent (CV: {cv:.1f}%)** - "
                                "Work on maintaining rhythm. Consider running with music at target cadence.")
     
-    # Check for declining trend
-    if len(act_df) >= 10:
-        recent_avg = act_df.tail(5)['avg_cadence'].mean()
-        older_avg = act_df.tail(10).head(5)['avg_cadence'].mean()
-        if recent_avg < older_avg - 3:
-            recommendations.append("🟡 **Cadence declining** - You may be fatigued. Check recovery metrics.")
+    # Check for declining trend (cadence_delta is 0 with fewer than 10 runs)
+    if cadence_delta < -3:
+        recommendations.append("🟡 **Cadence declining** - You may be fatigued. Check recovery metrics.")
     
     if recommendations:
         for rec in recommendations:
@@ -599,13 +609,19 @@ try:
     # ============================================
     with st.expander("Debug: Recent Activity Metrics"):
         st.markdown("**Last 10 Activities:**")
-        st.markdown("| Date | Activity | Dist | Cadence | Stride |")
-        st.markdown("|------|----------|------|---------|--------|")
-        for _, row in act_df.tail(10).iterrows():
-            st.markdown(
-                f"| {row['date'].strftime('%Y-%m-%d')} | {row['name'][:25]} | "
-                f"{row['distance_km']:.1f}km | {row['avg_cadence']:.0f} | {row['avg_stride_m']:.2f}m |"
-            )
+        # Format each column once, then join cells into rows
+        last_10 = act_df.tail(10)
+        debug_rows = "| " + last_10['date'].dt.strftime('%Y-%m-%d').str.cat([
+            last_10['name'].str.slice(0, 25),
+            last_10['distance_km'].map('{:.1f}km'.format),
+            last_10['avg_cadence'].map('{:.0f}'.format),
+            last_10['avg_stride_m'].map('{:.2f}m'.format),
+        ], sep=" | ") + " |"
+        st.markdown("\n".join([
+            "| Date | Activity | Dist | Cadence | Stride |",
+            "|------|----------|------|---------|--------|",
+            *debug_rows,
+        ]))
 
 except Exception as e:
     st.error(f"Error loading data: {e}")
@@ -5,327 +5,383 @@ Track actual training vs planned targets for the 20-week HM campaign.
 """
 
 import streamlit as st
-import plotly.graph_objects as go
+import os
+import traceback
 import plotly.express as px
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
-sys.path.append(str(Path(__file__).parent.parent.parent))
+# Add parent directories to path for imports (once; the script reruns on every interaction)
+for _p in (str(Path(__file__).parent.parent), str(Path(__file__).parent.parent.parent)):
+    if _p not in sys.path:
+        sys.path.append(_p)
 
-from utils.data_loader import activities_to_dataframe, get_weekly_summary
+from utils.data_loader import activities_to_dataframe
 from scripts.ai.plan_data import (
     CAMPAIGN_START, WEEKLY_PLAN, PHASE_PACES, KEY_DATES,
     get_campaign_week, get_phase_for_week,
 )
 
+# Compliance % bands: <70 missed, 70-90 close, >=90 hit
+COMPLIANCE_BINS = [-np.inf, 70, 90, np.inf]
+COMPLIANCE_COLORS = ['#e74c3c', '#f39c12', '#2ecc71']
+COMPLIANCE_STATUS = ['🔴 Missed', '🟡 Close', '🟢 Hit']
+
+# Activity columns used by this page
+CAMPAIGN_COLUMNS = ['date', 'name', 'distance_km', 'avg_hr', 'avg_pace_min_km']
+# Compact numpy dtypes for the campaign frame (pyarrow-backed dtypes are off the table, see ADR-0001).
+# distance_km and avg_hr stay float64: weekly sums feed the compliance thresholds.
+CAMPAIGN_DTYPES = {'campaign_week': 'int8'}
+
+# Plan as a table (one row per week), joined against actuals on each run
+PLAN_DF = pd.DataFrame.from_dict(WEEKLY_PLAN, orient='index').rename_axis('week_num').reset_index()
+_key_workout = PLAN_DF['key_workout']
+PLAN_DF['key_workout_short'] = _key_workout.where(
+    _key_workout.str.len() <= 35, _key_workout.str.slice(0, 35) + "..."
+)
+PLAN_DF['phase_display'] = PLAN_DF['phase'].where(
+    ~PLAN_DF['phase'].str.contains("RACE"), "**" + PLAN_DF['phase'] + "**"
+)
+
 # Page config
 st.set_page_config(page_title="Plan Compliance", page_icon="✅", layout="wide")
 
 st.title("Plan Compliance")
 st.markdown("Track actual training vs 20-week plan targets")
 
-try:
-    df = activities_to_dataframe()
-    weekly = get_weekly_summary(df)
+# Load data
+@st.cache_data(ttl=300)  # Cache for 5 minutes to avoid pickle issues
+def load_data():
+    return activities_to_dataframe()
+
+@st.cache_data(ttl=300)
+def read_plan(path_str, mtime):
+    """Read plan.md once per file change (mtime is part of the cache key)"""
+    return Path(path_str).read_text(encoding='utf-8')
+
+@st.cache_data(ttl=300)
+def compliance_figure(comp_df):
+    """Planned-vs-actual chart as a plain Plotly figure dict (no go.Figure objects)"""
+    colors = pd.cut(
+        comp_df['compliance'], COMPLIANCE_BINS, labels=COMPLIANCE_COLORS, right=False
+    ).tolist()
+    
+    return {
+        "data": [
+            # Target bars (background)
+            {
+                "type": "bar",
+                "x": comp_df['week'].tolist(),
+                "y": comp_df['target'].tolist(),
+                "name": "Target",
+                "marker": {"color": "rgba(200, 200, 200, 0.5)"},
+                "text": [f"{t}km" for t in comp_df['target']],
+                "textposition": "outside",
+            },
+            # Actual bars (foreground with color coding)
+            {
+                "type": "bar",
+                "x": comp_df['week'].tolist(),
+                "y": comp_df['actual'].tolist(),
+                "name": "Actual",
+                "marker": {"color": colors},
+                "text": [f"{a:.1f}km" for a in comp_df['actual']],
+                "textposition": "inside",
+            },
+        ],
+        "layout": {
+            "barmode": "overlay",
+            "xaxis": {"title": {"text": "Week"}},
+            "yaxis": {"title": {"text": "Volume (km)"}},
+            "height": 400,
+            "legend": {"orientation": "h", "yanchor": "bottom", "y": 1.02},
+        },
+    }
+
+@st.cache_data(ttl=300)
+def plan_status_markdown(current_week, actual_key, _plan_vs_actual):
+    """Render the Full Plan Status table as one markdown string.
+
+    actual_key (the weekly actuals in week order) stands in for the
+    unhashed _plan_vs_actual frame in the cache key.
+    """
+    plan_rows = [
+        "| Week | Phase | Target | Actual | Status | Key Workout |",
+        "|------|-------|--------|--------|--------|-------------|",
+    ]
     
-    if df.empty:
-        st.error("No running activities found. Run `python scripts/incremental-sync.py --days 90` to sync data.")
-        st.stop()
+    is_upcoming = _plan_vs_actual['week_num'] > current_week
+    
+    for row in _plan_vs_actual[~is_upcoming].itertuples(index=False):
+        if row.week_num == current_week:
+            status = "🔵 In Progress" if row.compliance < 100 else "🟢 Complete"
+        else:
+            status = row.status
+        
+        plan_rows.append(
+            f"| {row.week_num} | {row.phase_display} | {row.volume_km}km | "
+            f"{row.actual:.1f}km | {status} | {row.key_workout_short} |"
+        )
+    
+    # Future weeks have no actuals to look at
+    plan_rows.extend(
+        f"| {row.week_num} | {row.phase_display} | {row.volume_km}km | - | ⬜ Upcoming | {row.key_workout_short} |"
+        for row in _plan_vs_actual[is_upcoming].itertuples(index=False)
+    )
+    
+    return "\n".join(plan_rows)
 
-    # Filter to campaign period
-    campaign_df = df[df['date'] >= CAMPAIGN_START].copy()
-    campaign_df['campaign_week'] = campaign_df['date'].apply(get_campaign_week)
+try:
+    df = load_data()
+except Exception as e:
+    st.error(f"Error loading data: {e}")
+    st.info("Try running `python scripts/incremental-sync.py --days 7` to refresh data cache.")
     
-    # Current week info
-    current_week = get_campaign_week(datetime.now())
-    current_phase = get_phase_for_week(current_week)
+    with st.expander("Error details"):
+        st.code(traceback.format_exc())
+    st.stop()
+
+if df.empty:
+    st.error("No running activities found. Run `python scripts/incremental-sync.py --days 90` to sync data.")
+    st.stop()
+
+# Filter to campaign period, keeping only the columns this page renders
+campaign_df = df.loc[df['date'] >= CAMPAIGN_START].reindex(columns=CAMPAIGN_COLUMNS)
+# Vectorized equivalent of get_campaign_week (dates are already >= CAMPAIGN_START)
+campaign_df['campaign_week'] = ((campaign_df['date'] - CAMPAIGN_START).dt.days // 7 + 1).clip(upper=20)
+campaign_df = campaign_df.astype(CAMPAIGN_DTYPES)
+
+# Per-week totals, computed once for the status cards, chart and plan table
+week_groups = campaign_df.groupby('campaign_week', sort=False)
+weekly_actual = week_groups['distance_km'].sum()
+weekly_count = week_groups.size()
+
+# Join plan targets with actuals once; feeds both the chart and the plan table
+plan_vs_actual = PLAN_DF.merge(
+    weekly_actual.rename('actual'), left_on='week_num', right_index=True, how='left'
+).fillna({'actual': 0.0})
+plan_vs_actual['compliance'] = (
+    plan_vs_actual['actual'] / plan_vs_actual['volume_km'] * 100
+).where(plan_vs_actual['volume_km'] > 0, 0)
+plan_vs_actual['status'] = pd.cut(
+    plan_vs_actual['compliance'], COMPLIANCE_BINS, labels=COMPLIANCE_STATUS, right=False
+)
+
+# Current week info
+now = datetime.now()
+days_to = {name: (date - now).days for name, date in KEY_DATES.items()}
+current_week = get_campaign_week(now)
+current_phase = get_phase_for_week(current_week)
+
+# ============================================
+# CAMPAIGN OVERVIEW
+# ============================================
+st.subheader("📅 Campaign Overview")
+
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    st.metric(
+        "Current Week",
+        f"Week {current_week}",
+        delta=current_phase,
+        delta_color="off"
+    )
+
+with col2:
+    st.metric(
+        "Days to 10K",
+        f"{days_to['10K Race']} days",
+        help="April 12, 2026"
+    )
+
+with col3:
+    st.metric(
+        "Days to HM",
+        f"{days_to['HM Race']} days",
+        help="May 24, 2026"
+    )
+
+with col4:
+    weeks_completed = max(0, current_week - 1)
+    completion = (weeks_completed / 20) * 100
+    st.metric(
+        "Plan Progress",
+        f"{completion:.0f}%",
+        delta=f"{weeks_completed}/20 weeks"
+    )
+
+# ============================================
+# CURRENT WEEK STATUS
+# ============================================
+st.markdown("---")
+st.subheader(f"📊 Week {current_week} Status: {current_phase}")
+
+if current_week in WEEKLY_PLAN:
+    plan = WEEKLY_PLAN[current_week]
     
-    # ============================================
-    # CAMPAIGN OVERVIEW
-    # ============================================
-    st.subheader("📅 Campaign Overview")
+    # Get this week's actual data
+    if current_week in weekly_count:
+        this_week_runs = week_groups.get_group(current_week)
+    else:
+        this_week_runs = campaign_df.iloc[0:0]
+    actual_volume = weekly_actual.get(current_week, 0.0)
+    actual_runs = weekly_count.get(current_week, 0)
+    target_volume = plan['volume_km']
     
-    col1, col2, col3, col4 = st.columns(4)
+    col1, col2, col3 = st.columns(3)
     
     with col1:
+        pct_complete = (actual_volume / target_volume * 100) if target_volume > 0 else 0
+        volume_status = "🟢" if pct_complete >= 90 else "🟡" if pct_complete >= 70 else "🔴"
         st.metric(
-            "Current Week",
-            f"Week {current_week}",
-            delta=current_phase,
-            delta_color="off"
+            f"{volume_status} Volume",
+            f"{actual_volume:.1f} / {target_volume} km",
+            delta=f"{pct_complete:.0f}% of target"
         )
     
     with col2:
-        days_to_10k = (KEY_DATES["10K Race"] - datetime.now()).days
         st.metric(
-            "Days to 10K",
-            f"{days_to_10k} days",
-            help="April 12, 2026"
+            "Runs Logged",
+            f"{actual_runs}",
+            help="Target: 3-4 runs per week"
         )
     
     with col3:
-        days_to_hm = (KEY_DATES["HM Race"] - datetime.now()).days
         st.metric(
-            "Days to HM",
-            f"{days_to_hm} days",
-            help="May 24, 2026"
+            "Key Workout",
+            plan['key_workout'][:30] + "..." if len(plan['key_workout']) > 30 else plan['key_workout'],
+            help=plan['key_workout']
         )
     
-    with col4:
-        weeks_completed = max(0, current_week - 1)
-        completion = (weeks_completed / 20) * 100
-        st.metric(
-            "Plan Progress",
-            f"{completion:.0f}%",
-            delta=f"{weeks_completed}/20 weeks"
-        )
-
-    # ============================================
-    # CURRENT WEEK STATUS
-    # ============================================
-    st.markdown("---")
-    st.subheader(f"📊 Week {current_week} Status: {current_phase}")
-    
-    if current_week in WEEKLY_PLAN:
-        plan = WEEKLY_PLAN[current_week]
-        
-        # Get this week's actual data
-        this_week_runs = campaign_df[campaign_df['campaign_week'] == current_week]
-        actual_volume = this_week_runs['distance_km'].sum()
-        actual_runs = len(this_week_runs)
-        target_volume = plan['volume_km']
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            pct_complete = (actual_volume / target_volume * 100) if target_volume > 0 else 0
-            volume_status = "🟢" if pct_complete >= 90 else "🟡" if pct_complete >= 70 else "🔴"
-            st.metric(
-                f"{volume_status} Volume",
-                f"{actual_volume:.1f} / {target_volume} km",
-                delta=f"{pct_complete:.0f}% of target"
-            )
-        
-        with col2:
-            st.metric(
-                "Runs Logged",
-                f"{actual_runs}",
-                help="Target: 3-4 runs per week"
-            )
-        
-        with col3:
-            st.metric(
-                "Key Workout",
-                plan['key_workout'][:30] + "..." if len(plan['key_workout']) > 30 else plan['key_workout'],
-                help=plan['key_workout']
-            )
-        
-        # This week's runs table
-        if not this_week_runs.empty:
-            st.markdown("**This Week's Runs:**")
-            st.markdown("| Date | Activity | Distance | Pace | Avg HR |")
-            st.markdown("|------|----------|----------|------|--------|")
-            for _, row in this_week_runs.iterrows():
-                pace = row.get('avg_pace_min_km', 'N/A') if 'avg_pace_min_km' in row else 'N/A'
-                hr = f"{row['avg_hr']:.0f}" if pd.notna(row.get('avg_hr')) else 'N/A'
-                st.markdown(f"| {row['date'].strftime('%a %b %d')} | {row['name'][:25]} | {row['distance_km']:.1f}km | {pace} | {hr} |")
-        else:
-            st.info("No runs logged this week yet.")
+    # This week's runs table
+    if not this_week_runs.empty:
+        st.markdown("**This Week's Runs:**")
+        # Format each column once, then join cells into rows
+        pace = this_week_runs['avg_pace_min_km']
+        hr = this_week_runs['avg_hr']
+        run_rows = "| " + this_week_runs['date'].dt.strftime('%a %b %d').str.cat([
+            this_week_runs['name'].str.slice(0, 25),
+            this_week_runs['distance_km'].map('{:.1f}km'.format),
+            pace.astype(object).where(pace.notna(), 'N/A').astype(str),
+            hr.map('{:.0f}'.format).where(hr.notna(), 'N/A'),
+        ], sep=" | ") + " |"
+        st.markdown("\n".join([
+            "| Date | Activity | Distance | Pace | Avg HR |",
+            "|------|----------|----------|------|--------|",
+            *run_rows,
+        ]))
     else:
-        st.warning("Campaign week not found in plan.")
+        st.info("No runs logged this week yet.")
+else:
+    st.warning("Campaign week not found in plan.")
 
-    # ============================================
-    # WEEKLY COMPLIANCE CHART
-    # ============================================
-    st.markdown("---")
-    st.subheader("📈 Weekly Volume: Planned vs Actual")
+# ============================================
+# WEEKLY COMPLIANCE CHART
+# ============================================
+st.markdown("---")
+st.subheader("📈 Weekly Volume: Planned vs Actual")
+
+# Weeks to date from the joined plan table
+comp_df = plan_vs_actual.loc[
+    plan_vs_actual['week_num'] <= current_week,
+    ['week_num', 'phase', 'volume_km', 'actual', 'compliance']
+].rename(columns={'volume_km': 'target'})
+comp_df.insert(0, 'week', 'W' + comp_df['week_num'].astype(str))
+
+if not comp_df.empty:
+    st.plotly_chart(compliance_figure(comp_df), use_container_width=True)
     
-    # Build comparison data
-    comparison_data = []
-    for week_num in range(1, min(current_week + 1, 21)):
-        if week_num in WEEKLY_PLAN:
-            plan = WEEKLY_PLAN[week_num]
-            week_runs = campaign_df[campaign_df['campaign_week'] == week_num]
-            actual = week_runs['distance_km'].sum()
-            target = plan['volume_km']
-            compliance = (actual / target * 100) if target > 0 else 0
-            
-            comparison_data.append({
-                'week': f"W{week_num}",
-                'week_num': week_num,
-                'phase': plan['phase'],
-                'target': target,
-                'actual': actual,
-                'compliance': compliance
-            })
+    # Compliance summary
+    avg_compliance = comp_df['compliance'].mean()
+    weeks_on_target = len(comp_df[comp_df['compliance'] >= 90])
     
-    if comparison_data:
-        comp_df = pd.DataFrame(comparison_data)
-        
-        fig = go.Figure()
-        
-        # Target bars (background)
-        fig.add_trace(go.Bar(
-            x=comp_df['week'],
-            y=comp_df['target'],
-            name='Target',
-            marker_color='rgba(200, 200, 200, 0.5)',
-            text=[f"{t}km" for t in comp_df['target']],
-            textposition='outside'
-        ))
-        
-        # Actual bars (foreground with color coding)
-        colors = ['#2ecc71' if c >= 90 else '#f39c12' if c >= 70 else '#e74c3c' 
-                  for c in comp_df['compliance']]
-        
-        fig.add_trace(go.Bar(
-            x=comp_df['week'],
-            y=comp_df['actual'],
-            name='Actual',
-            marker_color=colors,
-            text=[f"{a:.1f}km" for a in comp_df['actual']],
-            textposition='inside'
-        ))
-        
-        fig.update_layout(
-            barmode='overlay',
-            xaxis_title="Week",
-            yaxis_title="Volume (km)",
-            height=400,
-            legend=dict(orientation="h", yanchor="bottom", y=1.02)
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Compliance summary
-        avg_compliance = comp_df['compliance'].mean()
-        weeks_on_target = len(comp_df[comp_df['compliance'] >= 90])
-        
+    st.markdown(f"""
+    **Compliance Summary:** {avg_compliance:.0f}% average | 
+    {weeks_on_target}/{len(comp_df)} weeks on target (≥90%)
+    """)
+
+# ============================================
+# PHASE COMPLIANCE TABLE
+# ============================================
+st.markdown("---")
+st.subheader("📋 Full Plan Status")
+
+# Show all 20 weeks
+actual_key = tuple(plan_vs_actual['actual'].tolist())
+st.markdown(plan_status_markdown(current_week, actual_key, plan_vs_actual))
+
+# ============================================
+# UPCOMING KEY WORKOUTS
+# ============================================
+st.markdown("---")
+st.subheader("🎯 Upcoming Key Workouts")
+
+upcoming_weeks = range(current_week, min(current_week + 4, 21))
+for week_num in upcoming_weeks:
+    if week_num in WEEKLY_PLAN:
+        plan = WEEKLY_PLAN[week_num]
+        week_start = CAMPAIGN_START + timedelta(weeks=week_num - 1)
+
+        if week_num == current_week:
+            marker = "👉 **This Week**"
+        else:
+            marker = f"Week {week_num}"
+
         st.markdown(f"""
-        **Compliance Summary:** {avg_compliance:.0f}% average | 
-        {weeks_on_target}/{len(comp_df)} weeks on target (≥90%)
+        **{marker}** ({week_start.strftime('%b %d')}) - {plan['phase']}
+        - Volume: {plan['volume_km']}km
+        - Key: {plan['key_workout']}
         """)
 
-    # ============================================
-    # PHASE COMPLIANCE TABLE
-    # ============================================
-    st.markdown("---")
-    st.subheader("📋 Full Plan Status")
-    
-    # Show all 20 weeks
-    st.markdown("| Week | Phase | Target | Actual | Status | Key Workout |")
-    st.markdown("|------|-------|--------|--------|--------|-------------|")
-    
-    for week_num in range(1, 21):
-        if week_num in WEEKLY_PLAN:
-            plan = WEEKLY_PLAN[week_num]
-            week_runs = campaign_df[campaign_df['campaign_week'] == week_num]
-            actual = week_runs['distance_km'].sum()
-            target = plan['volume_km']
-            
-            if week_num > current_week:
-                status = "⬜ Upcoming"
-                actual_str = "-"
-            elif week_num == current_week:
-                pct = (actual / target * 100) if target > 0 else 0
-                status = "🔵 In Progress" if pct < 100 else "🟢 Complete"
-                actual_str = f"{actual:.1f}km"
-            else:
-                pct = (actual / target * 100) if target > 0 else 0
-                if pct >= 90:
-                    status = "🟢 Hit"
-                elif pct >= 70:
-                    status = "🟡 Close"
-                else:
-                    status = "🔴 Missed"
-                actual_str = f"{actual:.1f}km"
-            
-            phase_display = plan['phase']
-            if "RACE" in phase_display:
-                phase_display = f"**{phase_display}**"
-            
-            key_workout = plan['key_workout'][:35] + "..." if len(plan['key_workout']) > 35 else plan['key_workout']
-            
-            st.markdown(f"| {week_num} | {phase_display} | {target}km | {actual_str} | {status} | {key_workout} |")
-
-    # ============================================
-    # UPCOMING KEY WORKOUTS
-    # ============================================
+# ============================================
+# GOAL REVIEW CHECKPOINT
+# ============================================
+if current_week >= 6 and current_week <= 8:
     st.markdown("---")
-    st.subheader("🎯 Upcoming Key Workouts")
+    st.warning("📋 **Goal Review Checkpoint (Week 6-8)**")
+    st.markdown("""
+    Time to assess and potentially adjust goals based on:
+    - Weekly volume consistency: Are we hitting 35-40 km/week?
+    - Tempo pace progression: Can we sustain 5:50-6:00/km for 4-5km?
+    - VO2max trend: Moving toward 42-43?
+    - Recovery metrics: Sleep, RHR stable?
     
-    upcoming_weeks = range(current_week, min(current_week + 4, 21))
-    for week_num in upcoming_weeks:
-        if week_num in WEEKLY_PLAN:
-            plan = WEEKLY_PLAN[week_num]
-            week_start = CAMPAIGN_START + timedelta(weeks=week_num - 1)
-            
-            if week_num == current_week:
-                marker = "👉 **This Week**"
-            else:
-                marker = f"Week {week_num}"
-            
-            st.markdown(f"""
-            **{marker}** ({week_start.strftime('%b %d')}) - {plan['phase']}
-            - Volume: {plan['volume_km']}km
-            - Key: {plan['key_workout']}
-            """)
-
-    # ============================================
-    # GOAL REVIEW CHECKPOINT
-    # ============================================
-    if current_week >= 6 and current_week <= 8:
-        st.markdown("---")
-        st.warning("📋 **Goal Review Checkpoint (Week 6-8)**")
-        st.markdown("""
-        Time to assess and potentially adjust goals based on:
-        - Weekly volume consistency: Are we hitting 35-40 km/week?
-        - Tempo pace progression: Can we sustain 5:50-6:00/km for 4-5km?
-        - VO2max trend: Moving toward 42-43?
-        - Recovery metrics: Sleep, RHR stable?
-        
-        See plan.md for adjustment protocol.
-        """)
+    See plan.md for adjustment protocol.
+    """)
 
-    # ============================================
-    # FULL TRAINING PLAN (merged from Season Plan page)
-    # ============================================
-    st.markdown("---")
-    with st.expander("View Full Training Plan", expanded=False):
-        import os as _os
-        _use_sample = _os.getenv("USE_SAMPLE_DATA", "false").lower() == "true"
-        if _use_sample:
-            _plan_path = Path(__file__).parent.parent.parent / "sample-data" / "seasons" / "2025-sample-runner" / "plan.md"
-        else:
-            _plan_path = Path(__file__).parent.parent.parent / "seasons" / "2026-spring-hm-sub2" / "plan.md"
-        if _plan_path.exists():
-            with open(_plan_path, 'r', encoding='utf-8') as _f:
-                st.markdown(_f.read())
-        else:
-            st.info(f"Plan file not found: {_plan_path}")
-
-    # ============================================
-    # DEBUG EXPANDER
-    # ============================================
-    with st.expander("🔍 Debug: Campaign Data"):
-        st.markdown(f"**Campaign Start:** {CAMPAIGN_START.strftime('%Y-%m-%d')}")
-        st.markdown(f"**Current Date:** {datetime.now().strftime('%Y-%m-%d')}")
-        st.markdown(f"**Current Campaign Week:** {current_week}")
-        st.markdown(f"**Runs in Campaign Period:** {len(campaign_df)}")
-        
-        if not campaign_df.empty:
-            st.markdown("\n**Recent Campaign Runs:**")
-            for _, row in campaign_df.tail(5).iterrows():
-                st.markdown(f"- W{row['campaign_week']}: {row['name']} - {row['distance_km']:.1f}km")
+# ============================================
+# FULL TRAINING PLAN (merged from Season Plan page)
+# ============================================
+st.markdown("---")
+with st.expander("View Full Training Plan", expanded=False):
+    _use_sample = os.getenv("USE_SAMPLE_DATA", "false").lower() == "true"
+    if _use_sample:
+        _plan_path = Path(__file__).parent.parent.parent / "sample-data" / "seasons" / "2025-sample-runner" / "plan.md"
+    else:
+        _plan_path = Path(__file__).parent.parent.parent / "seasons" / "2026-spring-hm-sub2" / "plan.md"
+    if _plan_path.exists():
+        st.markdown(read_plan(str(_plan_path), _plan_path.stat().st_mtime))
+    else:
+        st.info(f"Plan file not found: {_plan_path}")
 
-except Exception as e:
-    st.error(f"Error loading data: {e}")
-    st.info("Try running `python scripts/incremental-sync.py --days 7` to refresh data cache.")
-    
-    with st.expander("Error details"):
-        import traceback
-        st.code(traceback.format_exc())
+# ============================================
+# DEBUG EXPANDER
+# ============================================
+with st.expander("🔍 Debug: Campaign Data"):
+    st.markdown(f"**Campaign Start:** {CAMPAIGN_START.strftime('%Y-%m-%d')}")
+    st.markdown(f"**Current Date:** {now.strftime('%Y-%m-%d')}")
+    st.markdown(f"**Current Campaign Week:** {current_week}")
+    st.markdown(f"**Runs in Campaign Period:** {len(campaign_df)}")
+
+    if not campaign_df.empty:
+        st.markdown("\n**Recent Campaign Runs:**")
+        recent_runs = campaign_df.tail(5)
+        run_lines = (
+            "- W" + recent_runs['campaign_week'].astype(str) + ": " + recent_runs['name']
+            + " - " + recent_runs['distance_km'].map('{:.1f}km'.format)
+        )
+        st.markdown("\n".join(run_lines))
@@ -8,9 +8,16 @@ For full narrative analysis, ask Copilot: "analyze my latest runs"
 import streamlit as st
 import json
 import sys
+from operator import itemgetter
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster parse of large insights files
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 sys.path.append(str(Path(__file__).parent.parent))
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
@@ -21,14 +28,25 @@ st.title("AI Run Overview")
 INSIGHTS_FILE = Path(__file__).parent.parent.parent / "tracking" / "ai-insights.json"
 
 
-def load_insights():
+@st.cache_data(ttl=300)
+def load_insights(mtime):
+    """Parse the insights file once per file change (mtime is part of the cache key)
+
+    Also returns runs/weeks pre-sorted newest first, so reruns skip the sort.
+    """
     if not INSIGHTS_FILE.exists():
         return None
-    with open(INSIGHTS_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    if ORJSON_AVAILABLE:
+        insights = orjson.loads(INSIGHTS_FILE.read_bytes())
+    else:
+        with open(INSIGHTS_FILE, "r", encoding="utf-8") as f:
+            insights = json.load(f)
+    insights["runs_sorted"] = sorted(insights.get("runs", {}).values(), key=itemgetter("date"), reverse=True)
+    insights["weeks_sorted"] = sorted(insights.get("weeks", {}).values(), key=itemgetter("week"), reverse=True)
+    return insights
 
 
-insights = load_insights()
+insights = load_insights(INSIGHTS_FILE.stat().st_mtime if INSIGHTS_FILE.exists() else 0)
 
 if not insights or not insights.get("runs"):
     st.warning("No AI insights found. Run sync with --enrich flag:")
@@ -37,9 +55,9 @@ if not insights or not insights.get("runs"):
     st.code("python -m scripts.ai.compute --days 60")
     st.stop()
 
-# Sort runs by date (newest first)
-runs = sorted(insights["runs"].values(), key=lambda x: x["date"], reverse=True)
-weeks = sorted(insights["weeks"].values(), key=lambda x: x["week"], reverse=True)
+# Runs and weeks come pre-sorted (newest first) from the cached loader
+runs = insights["runs_sorted"]
+weeks = insights["weeks_sorted"]
 
 # ============================================
 # LATEST RUN
@@ -133,8 +151,10 @@ st.subheader("Weekly Trends")
 
 if weeks:
     # Volume trend table
-    st.markdown("| Week | Phase | Volume | Target | Compliance | Runs | Streak | Longest |")
-    st.markdown("|------|-------|--------|--------|------------|------|--------|---------|")
+    rows = [
+        "| Week | Phase | Volume | Target | Compliance | Runs | Streak | Longest |",
+        "|------|-------|--------|--------|------------|------|--------|---------|",
+    ]
 
     for w in weeks[:8]:
         wm = w["metrics"]
@@ -146,13 +166,16 @@ if weeks:
         else:
             compliance_icon = "LOW"
 
-        st.markdown(
+        rows.append(
             f"| {w['week']} (CW{w['campaign_week']}) | {wm.get('plan_phase', '')} | "
             f"{wm['volume_km']:.1f}km | {wm['target_km']}km | "
             f"{wm['compliance_pct']:.0f}% {compliance_icon} | {wm['runs']} | "
             f"{wm['streak_weeks']}wk | {wm['longest_run_km']:.1f}km |"
         )
 
+    # One markdown block rather than one element per row
+    st.markdown("\n".join(rows))
+
     # 4-week volume trend
     if weeks[0]["metrics"].get("volume_trend_4wk"):
         trend = weeks[0]["metrics"]["volume_trend_4wk"]
@@ -166,19 +189,23 @@ if weeks:
 st.markdown("---")
 st.subheader("Recent Runs")
 
-st.markdown("| Date | Run | Dist | Pace | HR | Drift | Cadence | Phase |")
-st.markdown("|------|-----|------|------|----|-------|---------|-------|")
+rows = [
+    "| Date | Run | Dist | Pace | HR | Drift | Cadence | Phase |",
+    "|------|-----|------|------|----|-------|---------|-------|",
+]
 
 for r in runs[:10]:
     rm = r["metrics"]
     pace_drift = f"{rm['pace_drift_pct']:+.1f}%" if rm.get("pace_drift_pct") is not None else "N/A"
     hr_drift = f"{rm['hr_drift_pct']:+.1f}%" if rm.get("hr_drift_pct") is not None else "N/A"
-    st.markdown(
+    rows.append(
         f"| {r['date']} | {r['name'][:25]} | {rm['distance_km']}km | "
         f"{rm['avg_pace']} | {rm['avg_hr']:.0f} | P:{pace_drift} H:{hr_drift} | "
         f"{rm['cadence_avg']:.0f} | {rm.get('metrics', {}).get('plan_phase', '')} |"
     )
 
+st.markdown("\n".join(rows))
+
 # ============================================
 # COPILOT PROMPT
 # ============================================
@@ -0,0 +1,57 @@
+"""Tests for activity loading and weekly/monthly summaries."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils import data_loader
+
+
+ACTIVITIES = [
+    {'id': 1, 'type': 'running', 'date': '2026-01-05 07:00:00', 'distance_km': 10.0, 'avg_hr': 150},
+    {'id': 2, 'type': 'running', 'date': None, 'distance_km': 5.0, 'avg_hr': 140},
+    {'id': 3, 'type': 'running', 'date': '2026-01-07 07:00:00', 'distance_km': 8.0, 'avg_hr': 145},
+]
+
+
+def _runs_df(monkeypatch):
+    monkeypatch.setattr(data_loader, 'load_activities', lambda: [dict(a) for a in ACTIVITIES])
+    return data_loader.activities_to_dataframe()
+
+
+def test_missing_date_has_no_calendar_keys(monkeypatch):
+    df = _runs_df(monkeypatch)
+
+    missing = df[df['date'].isna()].iloc[0]
+    assert pd.isna(missing['day_of_week'])
+    assert pd.isna(missing['week_key'])
+    assert pd.isna(missing['month_key'])
+    assert df['day_of_week'].dropna().tolist() == ['Monday', 'Wednesday']
+
+
+def test_summaries_skip_missing_date(monkeypatch):
+    df = _runs_df(monkeypatch)
+
+    weekly = data_loader.get_weekly_summary(df)
+    assert weekly['week_key'].tolist() == ['2026-W02']
+    assert weekly['distance_km'].tolist() == [18.0]
+    assert weekly['runs'].tolist() == [2]
+
+    monthly = data_loader.get_monthly_summary(df)
+    assert monthly['month'].tolist() == ['2026-01']
+    assert monthly['runs'].tolist() == [2]
+
+
+def test_sleep_limit_tolerates_missing_date(monkeypatch):
+    sleep = [
+        {'date': '2026-01-06', 'sleep_hours': 7.0},
+        {'date': None, 'sleep_hours': 6.0},
+        {'date': '2026-01-05', 'sleep_hours': 8.0},
+    ]
+    monkeypatch.setattr(data_loader, 'load_garmin_data', lambda: {'sleep': sleep})
+
+    nights = data_loader.get_sleep_data(limit=2)
+    assert [n['date'] for n in nights] == ['2026-01-05', '2026-01-06']
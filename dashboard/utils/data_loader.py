@@ -7,8 +7,15 @@ import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson  # Optional: faster parse of the multi-MB cache files
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # Environment variable to use sample data (for GitHub demos)
 USE_SAMPLE_DATA = os.getenv("USE_SAMPLE_DATA", "false").lower() == "true"
@@ -19,19 +26,49 @@ BASE_DIR = Path(__file__).parent.parent.parent
 GARMIN_CACHE_FILE = BASE_DIR / DATA_DIR / "garmin-cache.json"
 UNIFIED_CACHE_FILE = BASE_DIR / DATA_DIR / "unified-cache.json"
 
+# Weekly/monthly volume status, worst first
+STATUS_CATEGORIES = ['RED', 'YELLOW', 'GREEN']
+
 if USE_SAMPLE_DATA:
     print(f"Using SAMPLE DATA from {DATA_DIR}/")
 else:
     print(f"Using PERSONAL DATA from {DATA_DIR}/")
 
 
+def _read_json(path: Path):
+    """Parse a JSON cache file, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Latest parse of each cache file, keyed by path: (mtime_ns, data)
+_JSON_CACHE: Dict[Path, tuple] = {}
+
+
+def _load_json(path: Path):
+    """
+    Parsed cache file, re-read only when a sync rewrites it
+
+    Each call costs one stat(); the file is parsed again only when its
+    mtime changes, and the previous version is dropped. The result is
+    shared between callers, so treat it as read-only.
+    """
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _JSON_CACHE.get(path)
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, _read_json(path))
+        _JSON_CACHE[path] = cached
+    return cached[1]
+
+
 def load_garmin_data() -> Dict:
     """Load all data from Garmin cache"""
     if not GARMIN_CACHE_FILE.exists():
         return {"activities": [], "training_status": {}, "sleep": [], "last_sync": None}
 
-    with open(GARMIN_CACHE_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return _load_json(GARMIN_CACHE_FILE)
 
 
 def load_activities() -> List[Dict]:
@@ -47,18 +84,15 @@ def load_activities() -> List[Dict]:
     """
     if UNIFIED_CACHE_FILE.exists():
         try:
-            with open(UNIFIED_CACHE_FILE, 'r', encoding='utf-8') as f:
-                unified_data = json.load(f)
-                return unified_data.get('activities', [])
+            unified_data = _load_json(UNIFIED_CACHE_FILE)
+            return unified_data.get('activities', [])
         except Exception as e:
             print(f"Warning: Could not load unified cache: {e}")
 
     # Fall back to Garmin cache
     garmin_data = load_garmin_data()
-    activities = garmin_data.get('activities', [])
-    for act in activities:
-        act['source'] = 'garmin'
-    return activities
+    # Tag copies so the shared parsed cache is left untouched
+    return [{**act, 'source': 'garmin'} for act in garmin_data.get('activities', [])]
 
 
 def activities_to_dataframe() -> pd.DataFrame:
@@ -71,25 +105,27 @@ def activities_to_dataframe() -> pd.DataFrame:
     # Convert to DataFrame
     df = pd.DataFrame(activities)
 
+    # Filter to running activities only (before deriving columns for fewer rows)
+    df = df[df['type'] == 'running'].copy()
+
     # Parse date
     df['date'] = pd.to_datetime(df['date'])
+    dates = df['date'].dt
 
-    # Add derived columns
-    df['year'] = df['date'].dt.year
-    df['month'] = df['date'].dt.month
-    df['week'] = df['date'].dt.isocalendar().week
-    df['iso_year'] = df['date'].dt.isocalendar().year
-    df['day_of_week'] = df['date'].dt.day_name()
-    df['date_only'] = df['date'].dt.date
+    # Add derived columns (one isocalendar pass feeds both ISO fields)
+    iso = dates.isocalendar()
+    df['year'] = dates.year
+    df['month'] = dates.month
+    df['week'] = iso['week']
+    df['iso_year'] = iso['year']
+    df['day_of_week'] = dates.day_name()
+    df['date_only'] = dates.date
 
     # Week key for grouping
     df['week_key'] = df['iso_year'].astype(str) + '-W' + df['week'].astype(str).str.zfill(2)
 
     # Month key for grouping
-    df['month_key'] = df['date'].dt.strftime('%Y-%m')
-
-    # Filter to running activities only
-    df = df[df['type'] == 'running'].copy()
+    df['month_key'] = dates.strftime('%Y-%m')
 
     # Sort by date
     df = df.sort_values('date')
@@ -103,10 +139,13 @@ def get_training_status() -> Dict:
     return data.get('training_status', {})
 
 
-def get_sleep_data() -> List[Dict]:
-    """Get sleep data"""
+def get_sleep_data(limit: Optional[int] = None) -> List[Dict]:
+    """Get sleep data, optionally only the most recent `limit` nights (oldest first)"""
     data = load_garmin_data()
-    return data.get('sleep', [])
+    sleep = data.get('sleep', [])
+    if limit:
+        sleep = sorted(sleep, key=lambda s: s.get('date') or '')[-limit:]
+    return sleep
 
 
 def get_cadence_pace_analysis() -> Dict:
@@ -119,12 +158,11 @@ def get_last_sync_time() -> Optional[str]:
     """Get last sync timestamp from unified cache or Garmin cache"""
     if UNIFIED_CACHE_FILE.exists():
         try:
-            with open(UNIFIED_CACHE_FILE, 'r', encoding='utf-8') as f:
-                unified_data = json.load(f)
-                last_sync = unified_data.get('last_sync') or unified_data.get('build_date')
-                if last_sync:
-                    dt = datetime.fromisoformat(last_sync)
-                    return f"Unified: {dt.strftime('%Y-%m-%d %H:%M')}"
+            unified_data = _load_json(UNIFIED_CACHE_FILE)
+            last_sync = unified_data.get('last_sync') or unified_data.get('build_date')
+            if last_sync:
+                dt = datetime.fromisoformat(last_sync)
+                return f"Unified: {dt.strftime('%Y-%m-%d %H:%M')}"
         except Exception:
             pass
 
@@ -136,29 +174,41 @@ def get_last_sync_time() -> Optional[str]:
     return None
 
 
+def _volume_status(km: pd.Series) -> pd.Categorical:
+    """GREEN at 20+ km, YELLOW at 15+ km, otherwise RED"""
+    values = km.to_numpy()
+    status = np.select([values >= 20, values >= 15], ['GREEN', 'YELLOW'], default='RED')
+    return pd.Categorical(status, categories=STATUS_CATEGORIES)
+
+
 def get_weekly_summary(df: pd.DataFrame) -> pd.DataFrame:
     """Calculate weekly summary statistics"""
     if df.empty:
         return pd.DataFrame()
 
-    weekly = df.groupby('week_key').agg({
-        'distance_km': 'sum',
-        'id': 'count',
-        'avg_hr': 'mean',
-        'date_only': lambda x: ', '.join(sorted([str(d) for d in set(x)]))
-    }).reset_index()
+    grouped = df.groupby('week_key')
+    weekly = grouped.agg(
+        distance_km=('distance_km', 'sum'),
+        runs=('id', 'count'),
+        avg_hr=('avg_hr', 'mean')
+    )
 
-    weekly.columns = ['week_key', 'distance_km', 'runs', 'avg_hr', 'dates']
+    # Distinct run days per week: dedupe and sort the (week, day) pairs once,
+    # leaving only a plain string join per group
+    days = pd.DataFrame({
+        'week_key': df['week_key'],
+        'day': df['date'].to_numpy().astype('datetime64[D]').astype(str)
+    }).drop_duplicates().sort_values(['week_key', 'day'])
+    weekly['dates'] = days.groupby('week_key')['day'].agg(', '.join)
+    weekly = weekly.reset_index()
 
     # Add status
-    weekly['status'] = weekly['distance_km'].apply(
-        lambda x: 'GREEN' if x >= 20 else ('YELLOW' if x >= 15 else 'RED')
-    )
+    weekly['status'] = _volume_status(weekly['distance_km'])
 
-    # Parse week key to get year and week number for sorting
-    weekly[['year', 'week']] = weekly['week_key'].str.split('-W', expand=True)
-    weekly['year'] = weekly['year'].astype(int)
-    weekly['week'] = weekly['week'].astype(int)
+    # ISO year and week number for sorting (constant within a week key)
+    iso_parts = grouped[['iso_year', 'week']].first().to_numpy(dtype='int64')
+    weekly['year'] = iso_parts[:, 0]
+    weekly['week'] = iso_parts[:, 1]
 
     weekly = weekly.sort_values(['year', 'week'])
 
@@ -182,8 +232,6 @@ def get_monthly_summary(df: pd.DataFrame) -> pd.DataFrame:
     monthly['avg_km_per_week'] = monthly['distance_km'] / 4.33
 
     # Add status based on avg per week
-    monthly['status'] = monthly['avg_km_per_week'].apply(
-        lambda x: 'GREEN' if x >= 20 else ('YELLOW' if x >= 15 else 'RED')
-    )
+    monthly['status'] = _volume_status(monthly['avg_km_per_week'])
 
     return monthly
@@ -6,6 +6,7 @@ and the AI metrics engine.
 """
 
 from datetime import datetime
+from functools import lru_cache
 
 
 CAMPAIGN_START = datetime(2026, 1, 5)
@@ -86,13 +87,20 @@ HR_DRIFT_TARGETS = {
 
 def get_campaign_week(date: datetime) -> int:
     """Calculate which campaign week a date falls in (1-20). Returns 0 if before campaign."""
-    days_since_start = (date - CAMPAIGN_START).days
+    return _campaign_week_for_ordinal(date.toordinal())
+
+
+@lru_cache(maxsize=None)
+def _campaign_week_for_ordinal(ordinal: int) -> int:
+    # Keyed on the day ordinal so times within the same day share a cache entry
+    days_since_start = ordinal - CAMPAIGN_START.toordinal()
     if days_since_start < 0:
         return 0
     week = (days_since_start // 7) + 1
     return min(week, 20)
 
 
+@lru_cache(maxsize=None)
 def get_phase_for_week(week_num: int) -> str:
     """Get phase name for a given week number."""
     if week_num in WEEKLY_PLAN:
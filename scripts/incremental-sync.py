@@ -17,6 +17,7 @@ Usage:
 """
 
 import argparse
+import bisect
 import json
 import os
 import shutil
@@ -675,27 +676,33 @@ class IncrementalSync:
         
         return analysis
 
-    def _activities_match(self, act1: Dict, act2: Dict) -> bool:
-        """Check if two activities represent the same run"""
+    @staticmethod
+    def _activity_start(act: Dict) -> Optional[datetime]:
+        """Parse an activity's start time once; None if it is missing or malformed"""
         try:
-            date1 = datetime.strptime(act1['date'], '%Y-%m-%d %H:%M:%S')
-            date2 = datetime.strptime(act2['date'], '%Y-%m-%d %H:%M:%S')
-
-            # Must be within 2 hours
-            time_diff = abs((date1 - date2).total_seconds())
-            if time_diff > 7200:
-                return False
+            return datetime.strptime(act['date'], '%Y-%m-%d %H:%M:%S')
+        except (KeyError, TypeError, ValueError):
+            return None
 
-            # Must be within 0.1 km distance
-            dist1 = act1.get('distance_km', 0)
-            dist2 = act2.get('distance_km', 0)
-            dist_diff = abs(dist1 - dist2)
+    def _activities_match(self, act1: Dict, start1: Optional[datetime],
+                          act2: Dict, start2: Optional[datetime]) -> bool:
+        """Check if two activities represent the same run (start times pre-parsed)"""
+        if start1 is None or start2 is None:
+            return False
 
-            return dist_diff <= 0.1
+        # Must be within 2 hours
+        time_diff = abs((start1 - start2).total_seconds())
+        if time_diff > 7200:
+            return False
 
-        except:
+        # Must be within 0.1 km distance
+        try:
+            dist_diff = abs(act1.get('distance_km', 0) - act2.get('distance_km', 0))
+        except TypeError:
             return False
 
+        return dist_diff <= 0.1
+
     def merge_activity_fields(self, existing: Dict, new: Dict) -> Dict:
         """Merge new activity data into existing, preserving important fields"""
         merged = existing.copy()
@@ -739,8 +746,15 @@ class IncrementalSync:
         else:
             existing_by_id = {a.get('strava_id'): (i, a) for i, a in enumerate(existing_activities) if a.get('strava_id')}
 
+        # Parse each existing start time once, and keep (start, index) pairs sorted
+        # so a new activity only compares against runs within the 2-hour window
+        existing_starts = [self._activity_start(a) for a in existing_activities]
+        start_index = sorted((start, i) for i, start in enumerate(existing_starts) if start is not None)
+        match_window = timedelta(seconds=7200)
+
         for new_act in new_activities:
             new_act['source'] = source
+            new_start = self._activity_start(new_act)
 
             # Check if activity already exists by ID
             activity_id = new_act.get('id') if source == 'garmin' else new_act.get('strava_id')
@@ -756,8 +770,16 @@ class IncrementalSync:
 
             # Check if activity matches by date + distance
             matched = False
-            for i, existing in enumerate(existing_activities):
-                if self._activities_match(existing, new_act):
+            if new_start is not None:
+                lo = bisect.bisect_left(start_index, (new_start - match_window,))
+                hi = bisect.bisect_right(start_index, (new_start + match_window, len(existing_activities)))
+                # Lowest index first, so the same existing run wins as in a full scan
+                candidates = sorted(i for _, i in start_index[lo:hi])
+            else:
+                candidates = []
+            for i in candidates:
+                existing = existing_activities[i]
+                if self._activities_match(existing, existing_starts[i], new_act, new_start):
                     # Found matching activity
                     merged = self.merge_activity_fields(existing, new_act)
 
@@ -776,6 +798,9 @@ class IncrementalSync:
             if not matched:
                 # New activity - add it
                 existing_activities.append(new_act)
+                existing_starts.append(new_start)
+                if new_start is not None:
+                    bisect.insort(start_index, (new_start, len(existing_activities) - 1))
                 self.stats['added'] += 1
                 print(f"[ADD] New activity {new_act['date'][:10]} ({new_act['distance_km']}km)")
 